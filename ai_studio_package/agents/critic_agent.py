@@ -7,15 +7,34 @@ and potential improvement areas, then generates critique nodes.
 
 import os
 import json
+import hashlib
+import asyncio
 import logging
 import time
 import uuid
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON encoding, stdlib json is used otherwise
+    orjson = None
+
 # Import database and API functions
-from ai_studio_package.infra.db_enhanced import create_memory_node, get_memory_node, get_db_connection
-from ai_studio_package.infra.vector_adapter import generate_embedding_for_node_faiss, create_node_with_embedding
+from ai_studio_package.infra.db_enhanced import (
+    create_memory_node, get_memory_node, get_shared_db_connection, close_db_connection
+)
+from ai_studio_package.infra.vector_adapter import (
+    generate_embedding_for_node_faiss,
+    create_node_with_embedding,
+    create_nodes_with_embeddings
+)
 from ai_studio_package.infra.execution_logs import get_execution_logs, get_execution_stats
 
 # Set up logging
@@ -25,12 +44,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _json_dumps(obj: Any, pretty: bool = False) -> str:
+    """Serialize obj to a JSON string (compact, or 2-space indented if pretty), using orjson when available"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, option=option).decode()
+    if pretty:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(',', ':'))
+
+# Maximum number of generated critiques memoized by generate_critique
+CRITIQUE_CACHE_SIZE = 256
+
+# LRU cache of critiques keyed by (task_name, analysis text digest)
+_critique_cache: "OrderedDict[Tuple[Optional[str], str], str]" = OrderedDict()
+
 # Helper function to get a model for summarizing (replace with your actual model)
+@lru_cache(maxsize=1)
 def get_summarization_model():
-    """Get a summarization model for text generation"""
+    """Get the process-wide summarization model, loading it on first use"""
     # In a real implementation, you would load your model here
+    # import torch
     # from transformers import pipeline
-    # return pipeline("summarization")
+    # return pipeline("summarization", torch_dtype=torch.bfloat16)
     
     # For now, we'll just use a mock function
     class MockModel:
@@ -55,84 +91,76 @@ def analyze_execution_logs(
         min_entries: Minimum number of entries required for analysis
         
     Returns:
-        Dict with analysis results
+        Dict with structured analysis results (format_analysis_report renders them as text)
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        # Reuse this thread's connection so the analysis statements stay prepared;
+        # rows are only unpacked positionally, so skip the sqlite3.Row wrapper
+        cursor = get_shared_db_connection().cursor()
+        cursor.row_factory = None
         
         # Calculate time threshold
         time_threshold = int((datetime.now() - timedelta(days=days)).timestamp() * 1000)
         
-        # Build query
-        query = """
-        SELECT * FROM execution_logs 
+        # Build the analysis window: the most recent matching executions
+        window = """
+        SELECT status, error, latency FROM execution_logs 
         WHERE start_time >= ? 
         """
         params = [time_threshold]
         
         if task:
-            query += " AND task = ?"
+            window += " AND task = ?"
             params.append(task)
             
-        query += f" ORDER BY start_time DESC LIMIT {limit}"
+        window += " ORDER BY start_time DESC LIMIT ?"
+        params.append(limit)
         
-        # Execute query
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        # Aggregate counts and latency in SQLite instead of pulling rows into Python;
+        # slow executions are those taking more than twice the window's average latency
+        cursor.execute(f"""
+        WITH w AS ({window})
+        SELECT COUNT(*), COALESCE(SUM(status = 'success'), 0), AVG(latency),
+               (SELECT COUNT(*) FROM w WHERE latency > 2 * (SELECT AVG(latency) FROM w))
+        FROM w
+        """, params)
+        total_count, success_count, avg_latency, slow_count = cursor.fetchone()
         
-        if len(rows) < min_entries:
+        if total_count < min_entries:
             return {
                 "status": "insufficient_data",
-                "message": f"Not enough data points ({len(rows)} < {min_entries})"
+                "message": f"Not enough data points ({total_count} < {min_entries})"
             }
-            
-        # Calculate metrics
-        total_count = len(rows)
-        success_count = sum(1 for row in rows if row['status'] == 'success')
-        error_count = total_count - success_count
-        success_rate = success_count / total_count
         
-        # Calculate latency stats
-        latencies = [row['latency'] for row in rows]
-        avg_latency = sum(latencies) / len(latencies)
+        # Latency percentiles over the same window, computed vectorized
+        cursor.execute(f"SELECT latency FROM ({window})", params)
+        latencies = np.fromiter((latency for (latency,) in cursor), dtype=np.float64)
+        p50_latency, p95_latency, p99_latency = (float(p) for p in np.percentile(latencies, [50, 95, 99]))
+        
+        # Error histogram, keyed by the part of the message before the first colon
+        cursor.execute(f"""
+        SELECT substr(error, 1, instr(error || ':', ':') - 1) AS error_type, COUNT(*)
+        FROM ({window})
+        WHERE status = 'error' AND error IS NOT NULL AND error <> ''
+        GROUP BY error_type
+        ORDER BY 2 DESC
+        """, params)
+        
+        # Error patterns, most frequent first
+        error_patterns = [{"error": error_type, "count": count} for error_type, count in cursor]
         
-        # Analyze error patterns
-        error_patterns = {}
-        for row in rows:
-            if row['status'] == 'error' and row['error']:
-                error_type = row['error'].split(':')[0]
-                error_patterns[error_type] = error_patterns.get(error_type, 0) + 1
-                
-        # Generate analysis text
-        analysis = f"""Performance Analysis for {task if task else 'all tasks'}:
-
-Success Rate: {success_rate:.2%} ({success_count}/{total_count} successful)
-Average Latency: {avg_latency:.2f} seconds
-
-Error Distribution:
-{json.dumps(error_patterns, indent=2)}
-
-Recommendations:
-"""
-
-        # Add recommendations based on patterns
-        if success_rate < 0.9:
-            analysis += "- High error rate detected. Review error patterns and implement better error handling.\n"
-            
-        if avg_latency > 5.0:
-            analysis += "- High average latency. Consider optimization or caching strategies.\n"
-            
-        for error_type, count in error_patterns.items():
-            if count > total_count * 0.1:  # Error occurs in >10% of cases
-                analysis += f"- Frequent {error_type} errors. Implement specific handling for this case.\n"
-                
         return {
             "status": "success",
-            "success_rate": success_rate,
+            "task": task,
+            "total_count": total_count,
+            "success_count": success_count,
+            "success_rate": success_count / total_count,
             "avg_latency": avg_latency,
-            "error_patterns": error_patterns,
-            "analysis": analysis
+            "p50_latency": p50_latency,
+            "p95_latency": p95_latency,
+            "p99_latency": p99_latency,
+            "slow_count": slow_count,
+            "error_patterns": error_patterns
         }
         
     except Exception as e:
@@ -142,22 +170,93 @@ Recommendations:
             "message": str(e)
         }
 
-def generate_critique(analysis_text: str, task_name: Optional[str] = None) -> str:
+def format_analysis_report(analysis_result: Dict[str, Any]) -> str:
+    """
+    Format a successful analysis result as a human-readable report
+    
+    Args:
+        analysis_result: Result from analyze_execution_logs
+        
+    Returns:
+        str: Report text with the statistics and recommendations
+    """
+    task = analysis_result["task"]
+    total_count = analysis_result["total_count"]
+    success_rate = analysis_result["success_rate"]
+    avg_latency = analysis_result["avg_latency"]
+    slow_count = analysis_result["slow_count"]
+    error_patterns = analysis_result["error_patterns"]
+    
+    # Collect sections and join once
+    parts = [
+        f"Performance Analysis for {task if task else 'all tasks'}:",
+        "",
+        f"Success Rate: {success_rate:.2%} ({analysis_result['success_count']}/{total_count} successful)",
+        f"Average Latency: {avg_latency:.2f} seconds",
+        f"Latency Percentiles: p50 {analysis_result['p50_latency']:.2f}s, "
+        f"p95 {analysis_result['p95_latency']:.2f}s, p99 {analysis_result['p99_latency']:.2f}s",
+        f"Slow Executions (>2x average): {slow_count}",
+        "",
+        "Error Distribution:",
+        _json_dumps({pattern["error"]: pattern["count"] for pattern in error_patterns}),
+        "",
+        "Recommendations:"
+    ]
+
+    # Add recommendations based on patterns
+    if success_rate < 0.9:
+        parts.append("- High error rate detected. Review error patterns and implement better error handling.")
+        
+    if avg_latency > 5.0:
+        parts.append("- High average latency. Consider optimization or caching strategies.")
+        
+    if slow_count > total_count * 0.1:
+        parts.append("- Frequent latency outliers. Investigate the slowest executions for contention or cold starts.")
+        
+    for pattern in error_patterns:
+        if pattern["count"] > total_count * 0.1:  # Error occurs in >10% of cases
+            parts.append(f"- Frequent {pattern['error']} errors. Implement specific handling for this case.")
+    
+    return "\n".join(parts) + "\n"
+
+def generate_critique(analysis_text: str, task_name: Optional[str] = None, *, model=None) -> str:
     """
     Generate a critique based on the analysis text
     
     In a real implementation, this would use an LLM to generate
-    thoughtful insights and suggestions
+    thoughtful insights and suggestions. Generation is deterministic for a
+    given input, so critiques from the shared model are memoized on the task
+    name and a digest of the analysis text.
     
     Args:
         analysis_text: Text containing execution data for analysis
         task_name: Name of the task being analyzed
+        model: Optional preloaded model (defaults to the shared summarization model)
         
     Returns:
         str: Generated critique text
     """
+    if model is not None:
+        # Caller-supplied models are not memoized
+        return _generate_critique(analysis_text, task_name, model)
+    
+    key = (task_name, hashlib.blake2b(analysis_text.encode(), digest_size=16).hexdigest())
+    critique = _critique_cache.get(key)
+    if critique is not None:
+        _critique_cache.move_to_end(key)
+        return critique
+    
+    critique = _generate_critique(analysis_text, task_name, None)
+    _critique_cache[key] = critique
+    if len(_critique_cache) > CRITIQUE_CACHE_SIZE:
+        _critique_cache.popitem(last=False)
+    return critique
+
+def _generate_critique(analysis_text: str, task_name: Optional[str], model) -> str:
+    """Generate a critique without memoization (see generate_critique)"""
     # In a real implementation, this would use an LLM
-    # model = get_summarization_model()
+    # if model is None:
+    #     model = get_summarization_model()
     # return model.generate(analysis_text)
     
     # For now, return a mock critique
@@ -179,16 +278,16 @@ def generate_critique(analysis_text: str, task_name: Optional[str] = None) -> st
         f"- Review database query patterns for optimization opportunities"
     )
 
-def create_critique_node(analysis_result: Dict[str, Any], task_name: Optional[str] = None) -> Optional[str]:
+def build_critique_node(analysis_result: Dict[str, Any], task_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """
-    Create a memory node to store the critique
+    Build the memory node data for a critique without storing it
     
     Args:
         analysis_result: Result from analyze_execution_logs
         task_name: Name of the task being analyzed
         
     Returns:
-        Optional[str]: ID of the created node, or None if failed
+        Optional[Dict[str, Any]]: Node data, or None if the analysis was not successful
     """
     if analysis_result["status"] != "success":
         logger.info(f"Not creating critique node: {analysis_result['message']}")
@@ -196,14 +295,15 @@ def create_critique_node(analysis_result: Dict[str, Any], task_name: Optional[st
     
     # Prepare node data
     node_id = str(uuid.uuid4())
-    created_at = int(time.time() * 1000)
+    created_at = time.time_ns() // 1_000_000
     
     task_label = task_name if task_name else "all_tasks"
     
     node_data = {
         "id": node_id,
         "type": "critique",
-        "content": analysis_result["analysis"],
+        # Structured analysis, so consumers can parse the node content directly
+        "content": _json_dumps({key: value for key, value in analysis_result.items() if key != "status"}),
         "tags": ["critique", "self_improvement", task_label],
         "created_at": created_at,
         "updated_at": created_at,
@@ -218,6 +318,23 @@ def create_critique_node(analysis_result: Dict[str, Any], task_name: Optional[st
         }
     }
     
+    return node_data
+
+def create_critique_node(analysis_result: Dict[str, Any], task_name: Optional[str] = None) -> Optional[str]:
+    """
+    Create a memory node to store the critique
+    
+    Args:
+        analysis_result: Result from analyze_execution_logs
+        task_name: Name of the task being analyzed
+        
+    Returns:
+        Optional[str]: ID of the created node, or None if failed
+    """
+    node_data = build_critique_node(analysis_result, task_name)
+    if node_data is None:
+        return None
+    
     try:
         # Create the memory node with async embedding generation
         node_id = create_node_with_embedding(node_data, async_embedding=True)
@@ -276,6 +393,150 @@ def run_critic(
             "message": str(e)
         }
 
+def _analyze_for_critique(
+    task: Optional[str],
+    limit: int,
+    days: int,
+    min_entries: int
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """
+    Analyze one task and build its critique node without storing it
+    
+    Returns:
+        Tuple of the analysis result and the critique node data (None if there is nothing to store)
+    """
+    logger.info(f"Running critic agent for {'task: ' + task if task else 'all tasks'}")
+    analysis_result = analyze_execution_logs(
+        task=task,
+        limit=limit,
+        days=days,
+        min_entries=min_entries
+    )
+    return analysis_result, build_critique_node(analysis_result, task)
+
+def _store_critiques(
+    analyses: List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]
+) -> List[Dict[str, Any]]:
+    """Store all built critique nodes in one batch, queue their embeddings and assemble per-task results"""
+    node_data_list = [node_data for _, node_data in analyses if node_data is not None]
+    created = iter(create_nodes_with_embeddings(node_data_list) if node_data_list else [])
+    
+    results = []
+    for analysis_result, node_data in analyses:
+        node_id = next(created) if node_data is not None else None
+        if node_id:
+            logger.info(f"Created critique node with ID: {node_id}")
+        results.append({
+            "status": "success" if node_id else "no_action",
+            "analysis": analysis_result,
+            "node_id": node_id
+        })
+    return results
+
+def run_critic_many(
+    tasks: List[Optional[str]],
+    limit: int = 50,
+    days: int = 1,
+    min_entries: int = 5
+) -> List[Dict[str, Any]]:
+    """
+    Run the critic agent for several tasks, storing all critiques in one batch
+    
+    Args:
+        tasks: Task names to analyze (None analyzes all tasks)
+        limit: Maximum number of logs to analyze per task
+        days: Number of days to look back
+        min_entries: Minimum number of entries required for analysis
+        
+    Returns:
+        List of per-task results in the same format as run_critic
+    """
+    try:
+        analyses = [_analyze_for_critique(task, limit, days, min_entries) for task in tasks]
+        return _store_critiques(analyses)
+    except Exception as e:
+        logger.error(f"Error running critic agent: {e}")
+        return [{"status": "error", "message": str(e)} for _ in tasks]
+
+def run_critic_multi(
+    tasks: List[Optional[str]],
+    limit: int = 50,
+    days: int = 1,
+    min_entries: int = 5,
+    workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Variant of run_critic_many that analyzes tasks in parallel worker threads
+    
+    The analysis is SQLite-bound (sqlite3 releases the GIL while a query runs),
+    so threads overlap it without each worker re-importing the embedding stack
+    the way spawned processes would. Each thread opens its own connection and
+    closes it when its task is done; the critiques are then stored together in
+    one batch.
+    
+    Args:
+        tasks: Task names to analyze (None analyzes all tasks)
+        limit: Maximum number of logs to analyze per task
+        days: Number of days to look back
+        min_entries: Minimum number of entries required for analysis
+        workers: Number of worker threads (defaults to the CPU count)
+        
+    Returns:
+        List of per-task results in the same order as tasks
+    """
+    if not tasks:
+        return []
+    try:
+        max_workers = min(len(tasks), workers or os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="critic") as executor:
+            analyses = list(executor.map(
+                _run_and_close_connection, repeat(_analyze_for_critique),
+                tasks, repeat(limit), repeat(days), repeat(min_entries)
+            ))
+        return _store_critiques(analyses)
+    except Exception as e:
+        logger.error(f"Error running critic agent: {e}")
+        return [{"status": "error", "message": str(e)} for _ in tasks]
+
+def _run_and_close_connection(func, *args):
+    """Run func in a worker thread, closing the thread's cached DB connection afterwards"""
+    try:
+        return func(*args)
+    finally:
+        close_db_connection()
+
+async def run_critic_many_async(
+    tasks: List[Optional[str]],
+    limit: int = 50,
+    days: int = 1,
+    min_entries: int = 5
+) -> List[Dict[str, Any]]:
+    """
+    Async variant of run_critic_many that analyzes all tasks concurrently
+    
+    Each task's DB reads run in a worker thread so the tasks overlap; the
+    critiques are then stored together in one batch. The connection each worker
+    thread opens is closed before the thread is returned to the default executor.
+    
+    Args:
+        tasks: Task names to analyze (None analyzes all tasks)
+        limit: Maximum number of logs to analyze per task
+        days: Number of days to look back
+        min_entries: Minimum number of entries required for analysis
+        
+    Returns:
+        List of per-task results in the same order as tasks
+    """
+    try:
+        analyses = await asyncio.gather(*[
+            asyncio.to_thread(_run_and_close_connection, _analyze_for_critique, task, limit, days, min_entries)
+            for task in tasks
+        ])
+        return await asyncio.to_thread(_run_and_close_connection, _store_critiques, analyses)
+    except Exception as e:
+        logger.error(f"Error running critic agent: {e}")
+        return [{"status": "error", "message": str(e)} for _ in tasks]
+
 if __name__ == "__main__":
     import argparse
     
@@ -284,6 +545,7 @@ if __name__ == "__main__":
     parser.add_argument("--limit", type=int, default=50, help="Maximum number of logs to analyze")
     parser.add_argument("--days", type=int, default=1, help="Number of days to look back")
     parser.add_argument("--min-entries", type=int, default=5, help="Minimum entries needed for analysis")
+    parser.add_argument("--text-report", action="store_true", help="Print the analysis as a text report")
     
     args = parser.parse_args()
     
@@ -294,4 +556,8 @@ if __name__ == "__main__":
         min_entries=args.min_entries
     )
     
-    print(json.dumps(result, indent=2)) 
\ No newline at end of file
+    analysis_result = result.get("analysis", {})
+    if args.text_report and analysis_result.get("status") == "success":
+        print(format_analysis_report(analysis_result))
+    else:
+        print(_json_dumps(result, pretty=True))
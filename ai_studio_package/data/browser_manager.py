@@ -1,36 +1,349 @@
 import logging
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+# Selenium's webdriver package and webdriver_manager are imported where a
+# browser is actually driven, so importing this module stays cheap
+from selenium.common.exceptions import TimeoutException, WebDriverException
 import asyncio
-from typing import Optional, Dict, List, Any
+import atexit
+import io
+from typing import TYPE_CHECKING, Optional, Dict, List, Any, Tuple, Union, Callable
 import json
-import time # Import time for potential delays
+import time
 import os # Import os for platform-specific operations
-import random
-from datetime import datetime as dt # Import datetime directly
-import pytz # Import pytz for timezone handling
-from bs4 import BeautifulSoup
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime as dt, timezone # Import datetime directly
+from email.utils import parsedate_to_datetime
 import re
-import functools # Add functools import
+import functools
+import shutil
+import socket
+import tempfile
 from urllib.parse import urljoin, quote_plus
 import requests
+import lxml.html
+import lxml.etree
+from lxml.etree import XPath
 
 from ai_studio_package.infra.db_enhanced import get_db_connection
 
+if TYPE_CHECKING:
+    from selenium import webdriver
+
 logger = logging.getLogger(__name__)
 
+# User agent sent by both the HTTP session and the browser
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Timeout (seconds) for direct HTTP fetches of Nitter pages
+HTTP_TIMEOUT = 20
+
+# Default number of user timelines fetched concurrently by get_users_tweets
+USER_SCRAPE_CONCURRENCY = 8
+
+# Recently fetched timelines are reused for this many seconds, keeping up to
+# TWEET_CACHE_SIZE (username, max_tweets) entries
+TWEET_CACHE_TTL = 30
+TWEET_CACHE_SIZE = 512
+
+# Sub-resources and trackers the scrapers never need; blocked in the browser so
+# page loads only fetch the HTML
+BLOCKED_URL_PATTERNS = [
+    '*.css', '*.woff*', '*.ttf', '*.svg', '*.ico',
+    '*.mp4', '*.webp', '*.png', '*.jpg', '*.jpeg', '*.gif',
+    '*/fonts/*', '*/analytics*', '*google-analytics*',
+]
+
+# Persistent Chrome profile, so DNS, HSTS, TLS session and HTTP caches stay
+# warm across driver restarts and reboots (override with CHROME_PROFILE_DIR).
+# Chrome allows one instance per profile, so processes that find it in use
+# fall back to a temporary profile (see _chrome_profile_dir)
+CHROME_PROFILE_DIR = os.getenv(
+    'CHROME_PROFILE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'ai_studio_chrome_profile')
+)
+
+# Size (bytes) of Chrome's disk cache inside the profile
+CHROME_DISK_CACHE_SIZE = 256 * 1024 * 1024
+
+# Profile scraping scrolls: per-scroll wait and total wait budget, in seconds
+SCROLL_WAIT_TIMEOUT = 8
+SCROLL_WAIT_BUDGET = 12
+
+# Nitter tweet-date titles, e.g. "Jan 5, 2024 · 3:04 PM UTC"
+_DATE_RE = re.compile(r"([A-Z][a-z]{2}) (\d{1,2}), (\d{4}) · (\d{1,2}):(\d{2}) (AM|PM)")
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
+# strptime formats tried, in order, when a title does not match _DATE_RE
+# (e.g. 24-hour times or the day-first format of older Nitter releases)
+_DATE_FALLBACK_FORMATS = (
+    "%b %d, %Y · %H:%M",
+    "%d/%m/%Y, %H:%M:%S",
+)
+
+def _parse_tweet_date(title: Optional[str]) -> Optional[str]:
+    """Convert a Nitter tweet-date title to an ISO 8601 UTC timestamp.
+    
+    Args:
+        title: The title attribute of the tweet date link
+        
+    Returns:
+        The ISO timestamp, or None if the title is missing or unrecognised
+    """
+    if not title:
+        return None
+    match = _DATE_RE.match(title)
+    if not match:
+        return _parse_tweet_date_fallback(title)
+    month, day, year, hour, minute, meridiem = match.groups()
+    month = _MONTHS.get(month)
+    if not month:
+        return None
+    hour = int(hour) % 12 + (12 if meridiem == 'PM' else 0)
+    try:
+        return dt(int(year), month, int(day), hour, int(minute), tzinfo=timezone.utc).isoformat()
+    except ValueError:
+        return None
+
+def _chrome_profile_in_use(profile_dir: str) -> bool:
+    """Check whether a running Chrome holds the lock on a user-data-dir.
+    
+    On POSIX the lock is a SingletonLock symlink to "<hostname>-<pid>", which a
+    crashed Chrome leaves behind, so the pid is checked; on Windows Chrome keeps
+    a lockfile open instead.
+    """
+    if os.name == 'nt':
+        return os.path.exists(os.path.join(profile_dir, 'lockfile'))
+    try:
+        target = os.readlink(os.path.join(profile_dir, 'SingletonLock'))
+    except FileNotFoundError:
+        return False
+    except OSError:
+        return True # Not a symlink; assume it is held
+    hostname, _, pid = target.rpartition('-')
+    if hostname != socket.gethostname():
+        return True # Held from another host sharing the directory
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False # Stale lock, Chrome takes it over
+    except (ValueError, PermissionError):
+        return True
+    return True
+
+def _chrome_profile_dir() -> str:
+    """Pick the user-data-dir for a new Chrome.
+    
+    Returns:
+        CHROME_PROFILE_DIR, or a temporary profile (removed at exit) if another
+        Chrome, e.g. one started by a different process, is using it
+    """
+    if not _chrome_profile_in_use(CHROME_PROFILE_DIR):
+        return CHROME_PROFILE_DIR
+    profile_dir = tempfile.mkdtemp(prefix='ai_studio_chrome_')
+    atexit.register(shutil.rmtree, profile_dir, True)
+    logger.info(f"Chrome profile {CHROME_PROFILE_DIR} is in use, using temporary profile {profile_dir}")
+    return profile_dir
+
+# Path of the installed chromedriver binary, resolved once per process
+_driver_path: Optional[str] = None
+_driver_path_lock = threading.Lock()
+
+def _get_driver_path() -> str:
+    """Resolve the chromedriver binary on first use and return the cached path afterwards.
+    
+    A path in the CHROMEDRIVER_PATH environment variable is used as is. Otherwise
+    ChromeDriverManager().install() is run, which checks for driver updates over
+    the network, so it is kept out of every driver start after the first.
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = os.getenv('CHROMEDRIVER_PATH')
+            if not _driver_path:
+                from webdriver_manager.chrome import ChromeDriverManager
+                _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+def _parse_tweet_date_fallback(title: str) -> Optional[str]:
+    """Slow path of _parse_tweet_date for titles in other formats"""
+    text = title.removesuffix(' UTC').strip()
+    for fmt in _DATE_FALLBACK_FORMATS:
+        try:
+            return dt.strptime(text, fmt).replace(tzinfo=timezone.utc).isoformat()
+        except ValueError:
+            continue
+    return None
+
+# Nitter status URL path, e.g. http://localhost:8080/username/status/123456#m
+_STATUS_URL_RE = re.compile(r"/(?P<user>[^/]+)/status/(?P<id>\d+)")
+
+@functools.lru_cache(maxsize=4096)
+def _nitter_to_twitter_url(nitter_url: str) -> str:
+    """Convert a Nitter status URL to a Twitter/X.com URL.
+    
+    Example: http://localhost:8080/username/status/123456 -> https://x.com/username/status/123456
+    
+    Returns:
+        The X.com URL, or nitter_url unchanged if it is not a status URL
+    """
+    match = _STATUS_URL_RE.search(nitter_url)
+    if not match:
+        logger.error(f"Error converting Nitter URL {nitter_url}: not a status URL")
+        return nitter_url
+    return f"https://x.com/{match['user']}/status/{match['id']}"
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# Nitter timeline selectors, compiled once and reused for every tweet
+_X_PINNED = XPath(f".//*[{_has_class('pinned')}]")
+_X_TWEET_LINK_HREF = XPath(f".//a[{_has_class('tweet-link')}]/@href")
+_X_USERNAME = XPath(f".//*[{_has_class('username')}]")
+_X_CONTENT = XPath(f".//*[{_has_class('tweet-content')}]")
+_X_DATE_TITLE = XPath(f".//*[{_has_class('tweet-date')}]/a/@title")
+_X_STATS = XPath(f".//*[{_has_class('tweet-stats')}]//*[{_has_class('tweet-stat')}]")
+_X_TIMELINE = XPath(f"//div[{_has_class('timeline')}]")
+_X_PROFILE_CARDS = XPath(f"//*[{_has_class('profile-card')}]")
+_X_CARD_USERNAME = XPath(f".//*[{_has_class('profile-card-username')}]")
+_X_CARD_FULLNAME = XPath(f".//*[{_has_class('profile-card-fullname')}]")
+_X_CARD_LINK_HREF = XPath(f".//*[{_has_class('profile-card-link')}]/@href")
+_X_ICON_CLASS = XPath(f".//*[{_has_class('icon-container')}]/span[contains(@class, 'icon-')]/@class")
+
+# CSS selectors for the same elements, used by browser-side waits and lookups
+_SEL_TIMELINE = ".timeline"
+_SEL_TIMELINE_ITEM = "div.timeline-item"
+_SEL_PROFILE_CARD = ".profile-card"
+_SEL_CARD_USERNAME = ".profile-card-username"
+_SEL_CARD_FULLNAME = ".profile-card-fullname"
+_SEL_CARD_LINK = ".profile-card-link"
+_JS_COUNT_TIMELINE_ITEMS = f"return document.querySelectorAll('{_SEL_TIMELINE_ITEM}').length"
+# True once the page has settled and more than arguments[0] timeline items are rendered
+_JS_MORE_TIMELINE_ITEMS = (
+    f"return document.readyState === 'complete' && "
+    f"document.querySelectorAll('{_SEL_TIMELINE_ITEM}').length > arguments[0]"
+)
+
+# Reads handle, name and raw link of the first arguments[0] profile cards in one call
+_JS_EXTRACT_PROFILE_CARDS = f"""
+return Array.from(document.querySelectorAll('{_SEL_PROFILE_CARD}')).slice(0, arguments[0]).map(card => {{
+    const text = sel => {{ const el = card.querySelector(sel); return el ? el.innerText : null; }};
+    const link = card.querySelector('{_SEL_CARD_LINK}');
+    return {{
+        handle: text('{_SEL_CARD_USERNAME}'),
+        name: text('{_SEL_CARD_FULLNAME}'),
+        href: link ? link.getAttribute('href') : null
+    }};
+}});
+"""
+
+def _text_content(element) -> str:
+    """Concatenated text of an element and its descendants (etree elements lack text_content)"""
+    return ''.join(element.itertext())
+
+# Translation table deleting thousands separators from stat counts
+_NO_COMMA = str.maketrans('', '', ',')
+
+def _parse_count(text: str) -> int:
+    """Parse a Nitter stat count such as "1,234", "1.2K" or "3.4M".
+    
+    Returns:
+        The count, or 0 if the text is empty or malformed
+    """
+    if not text:
+        return 0
+    suffix = text[-1]
+    if suffix in 'KkMm':
+        try:
+            return int(float(text[:-1].translate(_NO_COMMA)) * (1_000 if suffix in 'Kk' else 1_000_000))
+        except ValueError:
+            return 0
+    count = 0
+    for ch in text:
+        if '0' <= ch <= '9':
+            count = count * 10 + (ord(ch) - 48)
+    return count
+
+# Tweet stat icon classes mapped to the TweetRecord stat fields
+_STAT_KEYS = {
+    'icon-comment': 'replies',
+    'icon-retweet': 'retweets',
+    'icon-quote': 'quotes',
+    'icon-heart': 'likes',
+    'icon-like': 'likes',
+}
+
+@dataclass(slots=True)
+class TweetRecord:
+    """A tweet parsed from a Nitter timeline."""
+    id: str
+    url: str
+    author: str
+    username: str
+    content: str
+    timestamp_str: Optional[str] = None
+    timestamp: Optional[str] = None
+    replies: int = 0
+    retweets: int = 0
+    quotes: int = 0
+    likes: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the tweet dict returned by BrowserManager."""
+        return {
+            'id': self.id,
+            'url': self.url,
+            'author': self.author,
+            'username': self.username,
+            'content': self.content,
+            'timestamp_str': self.timestamp_str,
+            'timestamp': self.timestamp,
+            'stats': {
+                'replies': self.replies,
+                'retweets': self.retweets,
+                'quotes': self.quotes,
+                'likes': self.likes,
+            },
+        }
+
+def _parse_rss_date(pub_date: Optional[str]) -> Optional[str]:
+    """Convert an RSS pubDate (RFC 2822) to an ISO 8601 UTC timestamp."""
+    if not pub_date:
+        return None
+    try:
+        return parsedate_to_datetime(pub_date).astimezone(timezone.utc).isoformat()
+    except (TypeError, ValueError):
+        return None
+
 class BrowserManager:
     def __init__(self):
         """Initialize the browser manager."""
         self.driver = None
         self.nitter_instance = os.getenv('NITTER_BASE_URL', 'http://localhost:8080')
         
+        # Short-lived timeline cache and in-flight fetches, keyed by (username, max_tweets, include_stats)
+        self._tweet_cache: "OrderedDict[Tuple[str, int, bool], Tuple[float, List[TweetRecord]]]" = OrderedDict()
+        self._tweet_fetches: Dict[Tuple[str, int, bool], asyncio.Future] = {}
+        
+        # Validators and parsed tweets of fetched pages, keyed by (url, max_tweets),
+        # for conditional requests; filled from executor threads, hence the lock
+        self._page_cache: "OrderedDict[Tuple[str, int], Tuple[Optional[str], Optional[str], List[TweetRecord]]]" = OrderedDict()
+        self._page_cache_lock = threading.Lock()
+        
+        # Threads for blocking HTTP work, kept apart from the loop's default
+        # executor so scraping is not throttled by unrelated blocking calls
+        self._executor = ThreadPoolExecutor(max_workers=USER_SCRAPE_CONCURRENCY, thread_name_prefix="scrape")
+        # Browser work runs one call at a time: the shared driver is serialized by
+        # _tab_lock anyway, and queued browser fallbacks must not tie up HTTP threads
+        self._browser_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="browser")
+        
         # Configure connection pool with higher limits
         self.session = requests.Session()
         adapter = requests.adapters.HTTPAdapter(
@@ -41,201 +354,334 @@ class BrowserManager:
         )
         self.session.mount('http://', adapter)
         self.session.mount('https://', adapter)
+        self.session.headers.update({'User-Agent': USER_AGENT})
         
         logger.info("Browser manager initialized with enhanced connection pool")
         
-    def _init_driver(self):
-        """Initialize the browser driver if not already initialized."""
-        if not self.driver:
+    # Chrome instance shared by all browser managers, the number of managers
+    # attached to it, and those managers, so a restart can detach all of them
+    # (see acquire_shared_driver / release_shared_driver)
+    _shared_driver = None
+    _shared_driver_refs = 0
+    _shared_driver_holders: "weakref.WeakSet[BrowserManager]" = weakref.WeakSet()
+    _shared_driver_lock = threading.Lock()
+    # Serializes page work on the shared driver: a WebDriver session has a single
+    # current window, so concurrent scrapes cannot each drive their own tab at once
+    _tab_lock = threading.Lock()
+
+    @classmethod
+    def acquire_shared_driver(cls, holder: Optional["BrowserManager"] = None):
+        """Take a reference to the Chrome driver shared by all browser managers.
+        
+        The driver is started on first use, and restarted if it no longer responds;
+        the lock makes concurrent calls wait for the same start-up instead of each
+        launching a Chrome.
+        
+        Args:
+            holder: Manager taking the reference; its driver attribute is set now
+                and cleared if the shared driver is closed
+        
+        Returns:
+            The shared driver, or None if it could not be started
+        """
+        with cls._shared_driver_lock:
+            if cls._shared_driver is not None and not cls._driver_alive(cls._shared_driver):
+                logger.info("Shared driver not alive. Setting up new driver.")
+                cls._detach_shared_driver()
+            if cls._shared_driver is None:
+                cls._shared_driver = cls._create_driver()
+                cls._shared_driver_refs = 0
+            if cls._shared_driver is not None:
+                cls._shared_driver_refs += 1
+                if holder is not None:
+                    cls._shared_driver_holders.add(holder)
+                    holder.driver = cls._shared_driver
+            return cls._shared_driver
+
+    @classmethod
+    def release_shared_driver(cls, driver, holder: Optional["BrowserManager"] = None):
+        """Drop a reference taken with acquire_shared_driver.
+        
+        The driver is quit once no browser manager uses it anymore. Releasing a
+        driver that has already been replaced or closed does nothing.
+        """
+        with cls._shared_driver_lock:
+            if driver is None or driver is not cls._shared_driver:
+                return
+            if holder is not None:
+                cls._shared_driver_holders.discard(holder)
+            cls._shared_driver_refs -= 1
+            if cls._shared_driver_refs > 0:
+                return
+            cls._shared_driver, cls._shared_driver_refs = None, 0
+            cls._shared_driver_holders.clear()
+        driver.quit()
+
+    @classmethod
+    def close_shared_driver(cls, driver=None):
+        """Quit the shared Chrome driver if it is running, whoever is using it.
+        
+        Every manager attached to it is detached, so its next use starts a new driver.
+        
+        Args:
+            driver: If given, only quit the shared driver if it is still this one,
+                so a stale reference cannot close a replacement another manager started.
+        """
+        with cls._shared_driver_lock:
+            if driver is not None and driver is not cls._shared_driver:
+                return
+            cls._detach_shared_driver()
+
+    @classmethod
+    def _detach_shared_driver(cls):
+        """Quit the shared driver and detach all its holders; call with _shared_driver_lock held."""
+        driver, cls._shared_driver, cls._shared_driver_refs = cls._shared_driver, None, 0
+        for holder in list(cls._shared_driver_holders):
+            holder.driver = None
+        cls._shared_driver_holders.clear()
+        if driver:
             try:
-                options = webdriver.ChromeOptions()
-                
-                # Basic headless setup
-                options.add_argument('--headless=new')
-                options.add_argument('--no-sandbox')
-                options.add_argument('--disable-dev-shm-usage')
-                
-                # Additional stability options
-                options.add_argument('--disable-gpu')  # Disable GPU hardware acceleration
-                options.add_argument('--disable-software-rasterizer')
-                options.add_argument('--disable-extensions')
-                options.add_argument('--disable-logging')
-                options.add_argument('--disable-notifications')
-                options.add_argument('--disable-default-apps')
-                options.add_argument('--disable-popup-blocking')
-                options.add_argument('--ignore-certificate-errors')
-                options.add_argument('--log-level=3')  # Only show fatal errors
-                
-                # Memory and performance options
-                options.add_argument('--disable-dev-shm-usage')
-                options.add_argument('--disable-features=TranslateUI')
-                options.add_argument('--disable-web-security')
-                options.add_argument('--disable-site-isolation-trials')
-                options.add_argument('--memory-pressure-off')
-                
-                # Create service with specific args
-                service = Service(
-                    ChromeDriverManager().install(),
-                    service_args=['--verbose', '--log-path=chromedriver.log']
-                )
-                
-                # Initialize driver with options and service
-                self.driver = webdriver.Chrome(service=service, options=options)
-                self.driver.set_page_load_timeout(30)  # Increased timeout
-                
-                # Apply CDP commands for enhanced browser control
-                self.driver.execute_cdp_cmd('Network.enable', {})
-                self.driver.execute_cdp_cmd('Network.setBypassServiceWorker', {'bypass': True})
-                
-                logger.info("Browser initialized successfully with enhanced options")
-                return True
-                
-            except Exception as e:
-                logger.error(f"Failed to initialize browser: {e}", exc_info=True)
-                if self.driver:
-                    try:
-                        self.driver.quit()
-                    except:
-                        pass
-                    self.driver = None
-                return False
-        return True
+                driver.quit()
+            except Exception:
+                pass # Ignore errors quitting a dead driver
 
-    def _apply_cdp_commands(self):
-        """Apply CDP commands to make the browser more stealthy."""
+    @staticmethod
+    def _driver_alive(driver) -> bool:
+        """Check that a driver's browser still responds."""
         try:
-            # Set user agent
-            self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            })
-            
-            # Hide webdriver
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-            # Additional stealth settings
-            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-                "source": """
-                    Object.defineProperty(navigator, 'plugins', {
-                        get: () => [1, 2, 3, 4, 5]
-                    });
-                    Object.defineProperty(navigator, 'languages', {
-                        get: () => ['en-US', 'en']
-                    });
-                    Object.defineProperty(navigator, 'platform', {
-                        get: () => 'Win32'
-                    });
-                """
-            })
-            
-            logger.info("CDP commands applied successfully")
+            return len(driver.window_handles) > 0
+        except WebDriverException as e:
+            logger.warning(f"Driver seems dead: {e}")
+            return False
         except Exception as e:
-            logger.error(f"Error applying CDP commands: {e}")
-            raise
+            logger.warning(f"Unexpected error checking driver status: {e}")
+            return False # Assume dead on unexpected errors
 
-    def _load_keywords(self) -> List[str]:
-        # ... implementation ...
-        return [] # Placeholder
+    def _ensure_driver(self) -> "webdriver.Chrome":
+        """Attach this manager to the shared browser driver, starting it if needed.
+        
+        The attached driver is health-checked on every call, and a dead one is
+        closed for all managers and replaced.
         
-    def setup_driver(self) -> webdriver.Chrome:
-        """Initialize Chrome driver with enhanced anti-detection options."""
-        logger.info("Setting up WebDriver with anti-detection...")
-        chrome_options = Options()
-        
-        # Headless and basic stability
-        if self.headless:
-            # Use the 'new' headless mode which is generally better
-            chrome_options.add_argument('--headless=new') 
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument("--window-size=1920,1080") # Define window size
-
-        # Performance / Reduced Footprint
-        chrome_options.add_argument('--disable-extensions')
-        chrome_options.add_argument('--disable-logging') # Different from excludeSwitches
-        chrome_options.add_argument('--disable-notifications')
-        chrome_options.add_argument('--disable-default-apps')
-        chrome_options.add_argument('--disable-popup-blocking')
-        chrome_options.add_argument('--blink-settings=imagesEnabled=false') # Disable images
-
-        # Anti-detection settings from MiraiSniper
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"]) # Combine excludes
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        # Add proxy if configured (existing logic)
-        if self.proxy_manager:
-            logger.info(f"Configuring proxy: {self.proxy_manager}")
-            chrome_options.add_argument(f'--proxy-server={self.proxy_manager}')
+        Raises:
+            WebDriverException: If the browser could not be started
+        """
+        driver = self.driver
+        if driver is not None:
+            if self._driver_alive(driver):
+                return driver
+            logger.info("Driver not alive. Setting up new driver.")
+            self.close_shared_driver(driver)
+            self.driver = None
+        driver = self.acquire_shared_driver(self)
+        if driver is None:
+            raise WebDriverException("Failed to start the shared browser")
+        return driver
+
+    @contextmanager
+    def _browser_tab(self):
+        """Hold the shared browser in a fresh tab for the duration of the block.
+        
+        Every page load on the shared driver must go through here: the tab lock
+        keeps other scrapes from navigating the browser mid-read, and the tab is
+        closed and the original window restored afterwards.
         
+        Yields:
+            The shared driver, switched to the new tab
+            
+        Raises:
+            WebDriverException: If the browser could not be started
+        """
+        with self._tab_lock:
+            driver = self._ensure_driver()
+            original_handle = driver.current_window_handle
+            driver.switch_to.new_window('tab')
+            try:
+                yield driver
+            finally:
+                driver.close()
+                driver.switch_to.window(original_handle)
+
+    @staticmethod
+    def _create_driver():
+        """Start a new Chrome driver, or return None if it fails to start."""
+        driver = None
         try:
-            # Initialize the Chrome WebDriver with service
-            # Suppress console window using creationflags (Windows specific)
-            service_args = []
-            creation_flags = 0
-            if os.name == 'nt': # Only use creation flags on Windows
-                 creation_flags = 0x08000000 # CREATE_NO_WINDOW
-                 
-            service = Service(ChromeDriverManager().install(), service_args=service_args, creationflags=creation_flags)
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+            from selenium import webdriver
+            from selenium.webdriver.chrome.service import Service
+            
+            options = webdriver.ChromeOptions()
+            
+            # Basic headless setup
+            options.add_argument('--headless=new')
+            options.add_argument('--no-sandbox')
+            options.add_argument('--disable-dev-shm-usage')
+            
+            # Additional stability options
+            options.add_argument('--disable-gpu')  # Disable GPU hardware acceleration
+            options.add_argument('--disable-software-rasterizer')
+            options.add_argument('--disable-extensions')
+            options.add_argument('--disable-logging')
+            options.add_argument('--disable-notifications')
+            options.add_argument('--disable-default-apps')
+            options.add_argument('--disable-popup-blocking')
+            options.add_argument('--ignore-certificate-errors')
+            options.add_argument('--log-level=3')  # Only show fatal errors
+            options.add_argument('--window-size=1920,1080')
+            options.add_argument('--blink-settings=imagesEnabled=false')  # Disable images
+            
+            # Anti-detection settings
+            options.add_argument(f'--user-agent={USER_AGENT}')
+            options.add_argument('--disable-blink-features=AutomationControlled')
+            options.add_experimental_option('excludeSwitches', ['enable-automation', 'enable-logging'])
+            options.add_experimental_option('useAutomationExtension', False)
+            
+            # Memory and performance options
+            options.add_argument('--disable-features=TranslateUI,BlinkGenPropertyTrees,OptimizationHints,MediaRouter')
+            options.add_argument('--disable-web-security')
+            options.add_argument('--disable-site-isolation-trials')
+            options.add_argument('--memory-pressure-off')
+            options.add_argument('--js-flags=--max-old-space-size=256')  # Cap the V8 heap
+            
+            # Skip background services, throttling and first-run work a scraper never needs
+            options.add_argument('--disable-background-networking')
+            options.add_argument('--disable-background-timer-throttling')
+            options.add_argument('--disable-renderer-backgrounding')
+            options.add_argument('--disable-breakpad')
+            options.add_argument('--disable-client-side-phishing-detection')
+            options.add_argument('--disable-component-update')
+            options.add_argument('--disable-hang-monitor')
+            options.add_argument('--disable-ipc-flooding-protection')
+            options.add_argument('--disable-sync')
+            options.add_argument('--metrics-recording-only')
+            options.add_argument('--mute-audio')
+            options.add_argument('--no-first-run')
+            options.add_argument('--safebrowsing-disable-auto-update')
+            options.add_argument('--password-store=basic')
+            
+            # Reuse a persistent profile and disk cache between runs; the cache
+            # lives in whichever profile was picked, so instances never share one
+            profile_dir = _chrome_profile_dir()
+            options.add_argument(f'--user-data-dir={profile_dir}')
+            options.add_argument(f'--disk-cache-dir={os.path.join(profile_dir, "cache")}')
+            options.add_argument(f'--disk-cache-size={CHROME_DISK_CACHE_SIZE}')
             
-            # Set page load timeout (from MiraiSniper)
-            driver.set_page_load_timeout(20) # Using 20s instead of 10s initially
+            # Return from driver.get() at DOMContentLoaded; callers wait for the
+            # elements they need, so sub-resource loads need not block navigation
+            options.page_load_strategy = 'eager'
             
-            # Apply CDP commands for stealth (from MiraiSniper)
-            logger.info("Applying CDP commands for stealth...")
-            driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-                "userAgent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            })
-            # The navigator.webdriver fix might need to run on each page load via execute_script
-            # driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            # We will add this execute_script call within get_user_tweets before waiting.
+            # Create service with specific args, without a console window on Windows
+            service = Service(
+                _get_driver_path(),
+                service_args=['--verbose', '--log-path=chromedriver.log'],
+                creationflags=0x08000000 if os.name == 'nt' else 0  # CREATE_NO_WINDOW
+            )
+            
+            # Initialize driver with options and service
+            driver = webdriver.Chrome(service=service, options=options)
+            driver.set_page_load_timeout(30)  # Increased timeout
             
-            logger.info("Browser initialized successfully with enhanced options.")
+            # Apply CDP commands for enhanced browser control
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBypassServiceWorker', {'bypass': True})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            driver.execute_cdp_cmd('Network.setCacheDisabled', {'cacheDisabled': False})
+            
+            logger.info("Browser initialized successfully with enhanced options")
             return driver
-        except Exception as e:
-            logger.error(f"Error setting up browser: {e}", exc_info=True)
-            raise
-    
-    async def get_driver(self) -> webdriver.Chrome:
-        async with self.lock:
-            if not self.driver or not self._is_driver_alive():
-                logger.info("Driver not initialized or not alive. Setting up new driver.")
-                if self.driver: # Close dead driver if exists
-                    try: 
-                        self.driver.quit()
-                    except: pass # Ignore errors quitting old driver
-                self.driver = await asyncio.to_thread(self.setup_driver)
-            return self.driver
             
-    def _is_driver_alive(self) -> bool:
-        if not self.driver:
-            return False
+        except Exception as e:
+            logger.error(f"Failed to initialize browser: {e}", exc_info=True)
+            if driver:
+                try:
+                    driver.quit()
+                except:
+                    pass
+            return None
+
+    def _load_keywords(self) -> List[str]:
+        # ... implementation ...
+        return [] # Placeholder
+        
+    async def get_driver(self) -> Optional["webdriver.Chrome"]:
+        """Get the shared browser driver, restarting it if it has died."""
+        loop = asyncio.get_running_loop()
         try:
-            # Check a simple property
-            _ = self.driver.title
-            # Optionally ping window handles
-            return len(self.driver.window_handles) > 0
+            return await loop.run_in_executor(self._browser_executor, self._ensure_driver)
         except WebDriverException as e:
-            logger.warning(f"Driver seems dead: {e}")
-            return False
-        except Exception as e:
-            logger.warning(f"Unexpected error checking driver status: {e}")
-            return False # Assume dead on unexpected errors
+            logger.error(f"Failed to get WebDriver instance: {e}")
+            return None
+            
+    def _is_driver_alive(self) -> bool:
+        return self.driver is not None and self._driver_alive(self.driver)
 
-    async def get_user_tweets(self, username: str, max_tweets: int = 50) -> List[dict]:
-        """Get tweets for a specific user using enhanced browser. Runs blocking Selenium calls in an executor."""
-        self._init_driver()  # Ensure driver is initialized
-        if not self.driver:
-            logger.error("Failed to get WebDriver instance.")
-            return []
+    async def get_user_tweets(self, username: str, max_tweets: int = 50, include_stats: bool = True) -> List[dict]:
+        """Get tweets for a specific user.
+        
+        Results are cached for TWEET_CACHE_TTL seconds, and concurrent calls for
+        the same user share a single fetch.
+        
+        Args:
+            username: Handle to fetch
+            max_tweets: Maximum number of tweets to return
+            include_stats: Whether engagement stats are needed. When False the much
+                smaller RSS feed is tried first, and stats are left at 0.
+        """
+        key = (username, max_tweets, include_stats)
+        cached = self._tweet_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            self._tweet_cache.move_to_end(key)
+            return [tweet.to_dict() for tweet in cached[1]]
+        
+        pending = self._tweet_fetches.get(key)
+        if pending:
+            return [tweet.to_dict() for tweet in await asyncio.shield(pending)]
+        
+        pending = asyncio.get_running_loop().create_future()
+        self._tweet_fetches[key] = pending
+        tweets: List[TweetRecord] = []
+        try:
+            tweets = await self._fetch_user_tweets(username, max_tweets, include_stats)
+        finally:
+            del self._tweet_fetches[key]
+            pending.set_result(tweets)
+        
+        # Empty results usually mean a failed fetch, so let the next call retry
+        if tweets:
+            self._tweet_cache[key] = (time.monotonic() + TWEET_CACHE_TTL, tweets)
+            self._tweet_cache.move_to_end(key)
+            while len(self._tweet_cache) > TWEET_CACHE_SIZE:
+                self._tweet_cache.popitem(last=False)
+        return [tweet.to_dict() for tweet in tweets]
 
+    async def _fetch_user_tweets(self, username: str, max_tweets: int = 50, include_stats: bool = True) -> List[TweetRecord]:
+        """Fetch tweets for a specific user, bypassing the cache.
+        
+        Nitter pages are server-rendered, so the timeline is fetched over plain HTTP
+        first; the browser is only started as a fallback when that fails. The RSS
+        feed comes before either when stats are not needed.
+        """
+        loop = asyncio.get_running_loop()
+        if not include_stats:
+            try:
+                tweets = await loop.run_in_executor(self._executor, self._http_get_user_rss, username, max_tweets)
+                if tweets is not None:
+                    return tweets
+            except Exception as e:
+                logger.error(f"Error in executor running _http_get_user_rss for {username}: {e}", exc_info=True)
+        
+        try:
+            tweets = await loop.run_in_executor(self._executor, self._http_get_user_tweets, username, max_tweets)
+            if tweets is not None:
+                return tweets
+        except Exception as e:
+            logger.error(f"Error in executor running _http_get_user_tweets for {username}: {e}", exc_info=True)
+        
+        logger.info(f"HTTP fetch of timeline failed for {username}, falling back to browser")
         try:
             # Run the synchronous scraping logic in a separate thread
-            loop = asyncio.get_running_loop()
             tweets = await loop.run_in_executor(
-                None, # Use default executor
+                self._browser_executor,
                 self._sync_get_user_tweets, # The sync function to run
                 username, 
                 max_tweets
@@ -245,121 +691,291 @@ class BrowserManager:
             logger.error(f"Error in executor running _sync_get_user_tweets for {username}: {e}", exc_info=True)
             return []
             
-    def _convert_nitter_to_twitter_url(self, nitter_url: str) -> str:
-        """Convert a Nitter URL to a Twitter/X.com URL."""
-        try:
-            # Extract username and tweet ID from Nitter URL
-            # Example: http://localhost:8080/username/status/123456 -> https://x.com/username/status/123456
-            parts = nitter_url.split('/')
-            username_idx = parts.index(parts[-3])  # Get username part
-            username = parts[username_idx]
-            tweet_id = parts[-1].split('#')[0]  # Remove any anchor
-            return f"https://x.com/{username}/status/{tweet_id}"
-        except Exception as e:
-            logger.error(f"Error converting Nitter URL {nitter_url}: {e}")
-            return nitter_url
-
-    def _sync_get_user_tweets(self, username: str, max_tweets: int = 50) -> List[dict]:
-        """Synchronous helper to get tweets with improved error handling."""
-        if not self._init_driver():
-            logger.error("[Executor] Failed to initialize driver")
-            return []
+    async def get_users_tweets(
+        self,
+        usernames: List[str],
+        max_tweets: int = 50,
+        concurrency: int = USER_SCRAPE_CONCURRENCY,
+        include_stats: bool = True
+    ) -> List[List[dict]]:
+        """Get tweets for several users concurrently.
+        
+        Args:
+            usernames: Handles to fetch
+            max_tweets: Maximum tweets per user
+            concurrency: Maximum number of timelines fetched at once
+            include_stats: Whether engagement stats are needed (see get_user_tweets)
             
-        tweets = []
-        processed_tweet_ids = set()
+        Returns:
+            One list of tweets per username, in the same order (empty on failure)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch(username: str) -> List[dict]:
+            async with semaphore:
+                return await self.get_user_tweets(username, max_tweets, include_stats)
+        
+        results = await asyncio.gather(*(fetch(u) for u in usernames), return_exceptions=True)
+        for username, result in zip(usernames, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error getting tweets for {username}: {result}")
+        return [[] if isinstance(result, BaseException) else result for result in results]
+
+    def _http_get_user_tweets(self, username: str, max_tweets: int = 50) -> Optional[List[TweetRecord]]:
+        """Fetch and parse a user's Nitter timeline over HTTP.
+        
+        Returns:
+            The parsed tweets, or None if the page could not be fetched or has no timeline
+            (so the caller can fall back to the browser).
+        """
         user_url = f"{self.nitter_instance}/{username}"
-        logger.info(f"[Executor] Navigating to: {user_url}")
+        return self._conditional_get(user_url, username, max_tweets, self._parse_timeline_html)
 
-        try:
-            self.driver.get(user_url)
-            wait = WebDriverWait(self.driver, 30)  # Increased timeout
+    def _http_get_user_rss(self, username: str, max_tweets: int = 50) -> Optional[List[TweetRecord]]:
+        """Fetch and parse a user's Nitter RSS feed.
+        
+        The feed carries ids, content, links and dates but no engagement stats.
+        
+        Returns:
+            The parsed tweets, or None if the feed could not be fetched or parsed.
+        """
+        rss_url = f"{self.nitter_instance}/{username}/rss"
+        return self._conditional_get(rss_url, username, max_tweets, self._parse_rss)
+
+    def _conditional_get(
+        self,
+        url: str,
+        username: str,
+        max_tweets: int,
+        parse: Callable[[bytes, str, int], Optional[List[TweetRecord]]]
+    ) -> Optional[List[TweetRecord]]:
+        """Fetch a Nitter page and parse it, revalidating any earlier copy.
+        
+        When the page was fetched before with an ETag or Last-Modified header, the
+        request is made conditional, and a 304 response reuses the earlier parse.
+        
+        Args:
+            url: Page to fetch
+            username: Handle the page belongs to
+            max_tweets: Maximum number of tweets to parse
+            parse: Parser for the response body
             
-            # Wait for timeline container
-            timeline = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".timeline")))
-            logger.info(f"[Executor] Timeline container found for {username}")
+        Returns:
+            The parsed tweets, or None if the page could not be fetched or parsed.
+        """
+        key = (url, max_tweets)
+        with self._page_cache_lock:
+            cached = self._page_cache.get(key)
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        logger.info(f"[HTTP] Fetching: {url}")
+        try:
+            response = self.session.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+        except requests.RequestException as e:
+            logger.warning(f"[HTTP] Request failed for {url}: {e}")
+            return None
+        if response.status_code == 304 and cached:
+            logger.info(f"[HTTP] Not modified: {url}")
+            return cached[2]
+        if response.status_code != 200:
+            logger.warning(f"[HTTP] Unexpected status {response.status_code} for {url}")
+            return None
+        
+        tweets = parse(response.content, username, max_tweets)
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        with self._page_cache_lock:
+            if tweets and (etag or last_modified):
+                self._page_cache[key] = (etag, last_modified, tweets)
+                self._page_cache.move_to_end(key)
+                while len(self._page_cache) > TWEET_CACHE_SIZE:
+                    self._page_cache.popitem(last=False)
+            else:
+                self._page_cache.pop(key, None)
+        return tweets
 
-            # Process tweets with better error handling
-            tweet_elements = self.driver.find_elements(By.CSS_SELECTOR, ".timeline-item")
-            for element in tweet_elements[:max_tweets]:
-                try:
-                    # Check for pinned tweet using JavaScript
-                    is_pinned = self.driver.execute_script(
-                        "return arguments[0].querySelector('.pinned') !== null",
-                        element
-                    )
-                    if is_pinned:
-                        continue
-                        
-                    # Get tweet link and ID
-                    permalink = element.find_element(By.CSS_SELECTOR, ".tweet-link")
-                    nitter_url = permalink.get_attribute("href")
-                    if not nitter_url:
-                        continue
-                        
-                    # Convert to absolute URL if relative
-                    if not nitter_url.startswith('http'):
-                        nitter_url = urljoin(self.nitter_instance, nitter_url)
-                        
-                    # Extract tweet ID and convert to x.com URL
-                    tweet_id = nitter_url.split('/')[-1].split('#')[0]
-                    if not tweet_id or tweet_id in processed_tweet_ids:
+    def _parse_rss(self, xml: bytes, username: str, max_tweets: int = 50) -> Optional[List[TweetRecord]]:
+        """Parse tweets from a Nitter RSS feed.
+        
+        Returns:
+            The parsed tweets, or None if the document is not an RSS feed.
+        """
+        try:
+            root = lxml.etree.fromstring(xml)
+        except lxml.etree.XMLSyntaxError as e:
+            logger.warning(f"Invalid RSS feed for {username}: {e}")
+            return None
+        channel = root.find('channel')
+        if channel is None:
+            logger.warning(f"No channel found in RSS feed for {username}")
+            return None
+        
+        tweets = []
+        processed_tweet_ids = set()
+        for item in channel.iterfind('item'):
+            if len(tweets) >= max_tweets:
+                break
+            try:
+                nitter_url = item.findtext('link') or item.findtext('guid')
+                if not nitter_url:
+                    continue
+                tweet_id = nitter_url.rstrip('/').split('/')[-1].split('#')[0]
+                if not tweet_id or tweet_id in processed_tweet_ids:
+                    continue
+                
+                # The description is the tweet as HTML; fall back to the plain-text title
+                description = item.findtext('description')
+                content = lxml.html.fromstring(description).text_content().strip() if description else item.findtext('title')
+                if not content:
+                    continue
+                
+                creator = item.findtext('{http://purl.org/dc/elements/1.1/}creator')
+                pub_date = item.findtext('pubDate')
+                tweets.append(TweetRecord(
+                    id=tweet_id,
+                    url=_nitter_to_twitter_url(nitter_url),
+                    author=creator.strip().lstrip('@') if creator else username,
+                    username=username,
+                    content=content,
+                    timestamp_str=pub_date,
+                    timestamp=_parse_rss_date(pub_date),
+                ))
+                processed_tweet_ids.add(tweet_id)
+                
+            except Exception as e:
+                logger.error(f"Error parsing RSS item for {username}: {e}")
+                continue
+        
+        return tweets
+
+    def _parse_timeline_html(self, html: Union[str, bytes], username: str, max_tweets: int = 50) -> Optional[List[TweetRecord]]:
+        """Parse tweets from a Nitter timeline page.
+        
+        The page is parsed incrementally: each timeline item is handled as soon as
+        its closing tag is read and then discarded, so the full document tree is
+        never held in memory, and parsing stops once max_tweets items are seen.
+        
+        Returns:
+            The parsed tweets, or None if the page has no timeline container.
+        """
+        if isinstance(html, str):
+            html = html.encode('utf-8')
+        
+        tweets = []
+        processed_tweet_ids = set()
+        found_timeline = False
+        item_count = 0
+        for _, element in lxml.etree.iterparse(io.BytesIO(html), tag='div', html=True, encoding='utf-8'):
+            classes = (element.get('class') or '').split()
+            if 'timeline' in classes:
+                found_timeline = True
+                continue
+            if 'timeline-item' not in classes:
+                continue
+            if item_count >= max_tweets:
+                break
+            item_count += 1
+            try:
+                if _X_PINNED(element):
+                    continue
+                
+                # Get tweet link and ID
+                hrefs = _X_TWEET_LINK_HREF(element)
+                nitter_url = hrefs[0] if hrefs else None
+                if not nitter_url:
+                    continue
+                    
+                # Convert to absolute URL if relative
+                if not nitter_url.startswith('http'):
+                    nitter_url = urljoin(self.nitter_instance, nitter_url)
+                    
+                tweet_id = nitter_url.split('/')[-1].split('#')[0]
+                if not tweet_id or tweet_id in processed_tweet_ids:
+                    continue
+                
+                # Get the actual author handle from the tweet
+                author_elements = _X_USERNAME(element)
+                author = _text_content(author_elements[0]).strip().lstrip('@') if author_elements else username
+                
+                # Skip tweets without content
+                content_elements = _X_CONTENT(element)
+                if not content_elements:
+                    continue
+                
+                titles = _X_DATE_TITLE(element)
+                
+                date_title = titles[0] if titles else None
+                tweet = TweetRecord(
+                    id=tweet_id,
+                    url=_nitter_to_twitter_url(nitter_url),
+                    author=author,
+                    username=username,
+                    content=_text_content(content_elements[0]).strip(),
+                    timestamp_str=date_title,
+                    timestamp=_parse_tweet_date(date_title),
+                )
+                
+                # Get tweet stats
+                for stat_elem in _X_STATS(element):
+                    icon_classes = _X_ICON_CLASS(stat_elem)
+                    if not icon_classes:
                         continue
+                    for cls in icon_classes[0].split():
+                        key = _STAT_KEYS.get(cls)
+                        if key:
+                            setattr(tweet, key, _parse_count(_text_content(stat_elem).strip()))
+                            break
+                
+                tweets.append(tweet)
+                processed_tweet_ids.add(tweet_id)
+                
+            except Exception as e:
+                logger.error(f"Error parsing tweet element for {username}: {e}")
+                continue
+            finally:
+                # Free the parsed item and everything before it
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+        
+        # Timeline items only appear inside the timeline container
+        if not found_timeline and not item_count:
+            logger.warning(f"No timeline container found in page for {username}")
+            return None
+        
+        return tweets
 
-                    # Get the actual author handle from the tweet
-                    try:
-                        author_element = element.find_element(By.CSS_SELECTOR, ".username")
-                        author = author_element.text.strip().lstrip('@')
-                    except NoSuchElementException:
-                        author = username  # Fallback to the username we're scraping
-                        
-                    tweet_data = {
-                        'id': tweet_id,
-                        'url': self._convert_nitter_to_twitter_url(nitter_url),
-                        'author': author,  # Use the actual author from the tweet
-                        'username': username  # Keep original username for reference
-                    }
-
-                    # Get tweet content
-                    try:
-                        content_element = element.find_element(By.CSS_SELECTOR, ".tweet-content")
-                        tweet_data['content'] = content_element.text.strip()
-                    except NoSuchElementException:
-                        continue  # Skip tweets without content
+    def _sync_get_user_tweets(self, username: str, max_tweets: int = 50) -> List[TweetRecord]:
+        """Synchronous helper to get tweets with improved error handling."""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        
+        user_url = f"{self.nitter_instance}/{username}"
+        logger.info(f"[Executor] Navigating to: {user_url}")
 
-                    # Get timestamp
-                    try:
-                        ts_element = element.find_element(By.CSS_SELECTOR, ".tweet-date > a")
-                        tweet_data['timestamp_str'] = ts_element.get_attribute('title')
-                    except NoSuchElementException:
-                        tweet_data['timestamp_str'] = None
+        try:
+            # Scrape in a fresh tab of the shared browser, then return to the original window
+            with self._browser_tab() as driver:
+                driver.get(user_url)
+                wait = WebDriverWait(driver, 30)  # Increased timeout
+                
+                # Wait for timeline container
+                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, _SEL_TIMELINE)))
+                logger.info(f"[Executor] Timeline container found for {username}")
 
-                    # Get tweet stats
-                    stats_map = {'comment': 0, 'retweet': 0, 'quote': 0, 'like': 0}
-                    try:
-                        stats_container = element.find_element(By.CSS_SELECTOR, ".tweet-stats")
-                        stat_elements = stats_container.find_elements(By.CSS_SELECTOR, ".tweet-stat")
-                        for stat_elem in stat_elements:
-                            icon_element = stat_elem.find_element(By.CSS_SELECTOR, ".icon-container span[class*='icon-']")
-                            icon_class = icon_element.get_attribute('class')
-                            count_text = stat_elem.text.strip().replace(',', '')
-                            count = int(count_text) if count_text.isdigit() else 0
-                            
-                            if 'icon-comment' in icon_class: stats_map['comment'] = count
-                            elif 'icon-retweet' in icon_class: stats_map['retweet'] = count
-                            elif 'icon-quote' in icon_class: stats_map['quote'] = count
-                            elif any(x in icon_class for x in ['icon-like', 'icon-heart']): stats_map['like'] = count
-                    except NoSuchElementException:
-                        pass
-                    tweet_data['stats'] = stats_map
-
-                    tweets.append(tweet_data)
-                    processed_tweet_ids.add(tweet_id)
-                    
-                except Exception as e:
-                    logger.error(f"[Executor] Error processing tweet: {str(e)}")
-                    continue
-                    
-            return tweets
+                # Read the rendered page once and parse it locally instead of
+                # querying the driver for every field of every tweet
+                page_source = driver.page_source
+            
+            tweets = self._parse_timeline_html(page_source, username, max_tweets)
+            return tweets or []
             
         except TimeoutException as te:
             logger.error(f"[Executor] Timeout loading page for {username}: {te}")
@@ -367,64 +983,56 @@ class BrowserManager:
         except Exception as e:
             logger.error(f"[Executor] Error scraping tweets for {username}: {e}", exc_info=True)
             return []
-        finally:
-            # Ensure we're not leaving any stale connections
-            if hasattr(self, 'session'):
-                self.session.close()
 
     async def search_users(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Search for users on Nitter and return basic profile info."""
-        driver = await self.get_driver()
-        if not driver:
-            logger.error("Failed to get WebDriver instance for user search.")
-            return []
-            
+        """Search for users on Nitter and return basic profile info.
+        
+        The search page is fetched over HTTP first; the browser is only used as a
+        fallback when that fails.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            users = await loop.run_in_executor(self._executor, self._http_search_users, query, limit)
+            if users is not None:
+                return users
+        except Exception as e:
+            logger.error(f"Error in executor running _http_search_users for '{query}': {e}", exc_info=True)
+        
+        logger.info(f"HTTP user search failed for '{query}', falling back to browser")
+        return await loop.run_in_executor(self._browser_executor, self._sync_search_users, query, limit)
+
+    def _sync_search_users(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Synchronous browser fallback for search_users, run on the browser executor."""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        
         search_url = f"{self.nitter_instance}/search?f=users&q={quote_plus(query)}" 
         logger.info(f"Navigating to user search: {search_url}")
         users = []
 
         try:
-            await asyncio.to_thread(driver.get, search_url)
-            
-            # Use asyncio.to_thread for WebDriver waits within async function
-            wait = WebDriverWait(driver, 15)
-            user_elements = await asyncio.to_thread(
-                wait.until, 
-                EC.presence_of_all_elements_located((By.CLASS_NAME, "profile-card"))
-            )
-            
-            logger.info(f"Found {len(user_elements)} potential user elements for query '{query}'. Limiting to {limit}")
+            # Search in a fresh tab of the shared browser, then return to the original window
+            with self._browser_tab() as driver:
+                driver.get(search_url)
+                WebDriverWait(driver, 15).until(
+                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, _SEL_PROFILE_CARD))
+                )
+                
+                # Read every card's fields in the page with a single WebDriver call
+                cards = driver.execute_script(_JS_EXTRACT_PROFILE_CARDS, limit)
+            logger.info(f"Found {len(cards)} potential user elements for query '{query}' (limit {limit})")
 
-            # Process elements - keep this part synchronous as it reads properties
-            for user_elem in user_elements[:limit]:
-                try:
-                    # These are synchronous Selenium calls, okay within this loop after async wait
-                    handle_elem = user_elem.find_element(By.CLASS_NAME, "profile-card-username")
-                    handle = handle_elem.text.strip("@")
-                    
-                    name_elem = user_elem.find_element(By.CLASS_NAME, "profile-card-fullname")
-                    name = name_elem.text.strip()
-                    
-                    profile_link_elem = user_elem.find_element(By.CLASS_NAME, "profile-card-link")
-                    profile_url_path = profile_link_elem.get_attribute("href")
-                    # Ensure the profile URL is absolute
-                    profile_url = urljoin(search_url, profile_url_path)
-                    
-                    user_obj = {
-                        'id': f"twitter_user_{handle}",
-                        'handle': handle,
-                        'name': name,
-                        'url': profile_url,
-                        'metadata': {
-                            'platform': 'twitter',
-                            'source': 'nitter_search'
-                        }
-                    }
-                    users.append(user_obj)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing user element: {e}", exc_info=True)
+            for card in cards:
+                if not card.get('handle') or not card.get('href'):
+                    logger.warning(f"Skipping incomplete profile card for query '{query}': {card}")
                     continue # Skip this user if parsing fails
+                users.append(self._user_result(
+                    card['handle'].strip().strip('@'),
+                    (card.get('name') or '').strip(),
+                    # Raw attribute may be relative; ensure the profile URL is absolute
+                    urljoin(search_url, card['href'])
+                ))
             
             logger.info(f"Successfully processed {len(users)} users for query '{query}'.")
             return users
@@ -440,24 +1048,76 @@ class BrowserManager:
              logger.error(f"Unexpected error during user search for '{query}': {e}", exc_info=True)
              return []
 
+    def _http_search_users(self, query: str, limit: int = 10) -> Optional[List[Dict[str, Any]]]:
+        """Fetch and parse a Nitter user search over HTTP.
+        
+        Returns:
+            The users found, or None if the page could not be fetched or has no
+            search results container (so the caller can fall back to the browser).
+        """
+        search_url = f"{self.nitter_instance}/search?f=users&q={quote_plus(query)}"
+        logger.info(f"[HTTP] Fetching: {search_url}")
+        try:
+            response = self.session.get(search_url, timeout=HTTP_TIMEOUT)
+        except requests.RequestException as e:
+            logger.warning(f"[HTTP] Request failed for {search_url}: {e}")
+            return None
+        if response.status_code != 200:
+            logger.warning(f"[HTTP] Unexpected status {response.status_code} for {search_url}")
+            return None
+        
+        users = []
+        tree = lxml.html.fromstring(response.content)
+        cards = _X_PROFILE_CARDS(tree)
+        # A 200 without results or a results container is a challenge or error page
+        if not cards and not _X_TIMELINE(tree):
+            logger.warning(f"[HTTP] No search results container found for query '{query}'")
+            return None
+        for card in cards[:limit]:
+            handles = _X_CARD_USERNAME(card)
+            hrefs = _X_CARD_LINK_HREF(card)
+            if not handles or not hrefs:
+                continue
+            names = _X_CARD_FULLNAME(card)
+            users.append(self._user_result(
+                handles[0].text_content().strip().strip('@'),
+                names[0].text_content().strip() if names else '',
+                urljoin(search_url, hrefs[0])
+            ))
+        
+        logger.info(f"[HTTP] Found {len(users)} users for query '{query}'")
+        return users
+
+    def _user_result(self, handle: str, name: str, profile_url: str) -> Dict[str, Any]:
+        """Build a user search result."""
+        return {
+            'id': f"twitter_user_{handle}",
+            'handle': handle,
+            'name': name,
+            'url': profile_url,
+            'metadata': {
+                'platform': 'twitter',
+                'source': 'nitter_search'
+            }
+        }
+
     async def close_driver(self):
-        """Close the WebDriver instance if it exists."""
-        async with self.lock:
-            if self.driver:
-                logger.info("Closing WebDriver instance.")
-                try:
-                    await asyncio.to_thread(self.driver.quit)
-                except Exception as e:
-                    logger.error(f"Error closing WebDriver: {e}")
-                finally:
-                    self.driver = None
+        """Detach from the shared WebDriver, which is quit once no manager uses it."""
+        if self.driver:
+            logger.info("Closing WebDriver instance.")
+            try:
+                await asyncio.get_running_loop().run_in_executor(self._browser_executor, self.release_shared_driver, self.driver, self)
+            except Exception as e:
+                logger.error(f"Error closing WebDriver: {e}")
+            finally:
+                self.driver = None
 
     def cleanup(self):
         """Clean up browser resources."""
         try:
             if self.driver:
                 try:
-                    self.driver.quit()
+                    self.release_shared_driver(self.driver, self)
                 except Exception as quit_error:
                     logger.error(f"Error during driver quit: {quit_error}")
                 finally:
@@ -468,96 +1128,96 @@ class BrowserManager:
                     self.session.close()
                 except Exception as session_error:
                     logger.error(f"Error closing session: {session_error}")
-                    
+            
+            self._executor.shutdown(wait=False)
+            self._browser_executor.shutdown(wait=False)
+            
             logger.info("Browser resources cleaned up successfully")
         except Exception as e:
             logger.error(f"Error in cleanup: {e}", exc_info=True)
 
     async def scrape_profile(self, handle: str, base_url: str = "https://nitter.net") -> List[Dict[str, Any]]:
-        """Scrapes tweets from a user's profile page on Nitter."""
-        if not self.driver:
-            logger.error("WebDriver not initialized. Cannot scrape profile.")
-            return []
+        """Scrapes tweets from a user's profile page on Nitter.
+        
+        The profile is fetched over HTTP first; the browser is only used as a
+        fallback when that fails.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            tweets = await loop.run_in_executor(self._executor, self._http_get_user_tweets, handle)
+            if tweets is not None:
+                return [tweet.to_dict() for tweet in tweets]
+        except Exception as e:
+            logger.error(f"Error in executor running _http_get_user_tweets for {handle}: {e}", exc_info=True)
+        
+        logger.info(f"[Scrape Profile] HTTP fetch failed for {handle}, falling back to browser")
+        return await loop.run_in_executor(self._browser_executor, self._sync_scrape_profile, handle)
 
+    def _sync_scrape_profile(self, handle: str) -> List[Dict[str, Any]]:
+        """Synchronous helper for scrape_profile, run on the browser executor."""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        
         profile_url = f"{self.nitter_instance}/{handle}"
         logger.info(f"[Scrape Profile] Attempting to scrape profile: {profile_url}")
         
         try:
-            self.driver.get(profile_url)
-            # Wait for potential redirects and initial page load
-            time.sleep(random.uniform(3, 5)) 
-            
-            page_title = self.driver.title
-            logger.info(f"[Scrape Profile] Landed on page with title: '{page_title}' for handle '{handle}'")
+            # Load the profile in a fresh tab of the shared browser, then return to the original window
+            with self._browser_tab() as driver:
+                driver.get(profile_url)
+                # Wait for potential redirects and the document to be parsed
+                # (interactive is enough with the eager page load strategy)
+                WebDriverWait(driver, 10).until(
+                    lambda d: d.execute_script("return document.readyState") in ("interactive", "complete")
+                )
+                
+                page_title = driver.title
+                logger.info(f"[Scrape Profile] Landed on page with title: '{page_title}' for handle '{handle}'")
 
-            # Scroll down to load more tweets (adjust scrolls and delay as needed)
-            for _ in range(2): # Scroll down twice
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(random.uniform(2, 4)) # Wait for content to load
+                # Scroll down to load more tweets, continuing as soon as new ones render.
+                # Both scrolls share one wait budget so a slow instance can't stall us.
+                deadline = time.monotonic() + SCROLL_WAIT_BUDGET
+                for _ in range(2): # Scroll down twice
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    prev_count = driver.execute_script(_JS_COUNT_TIMELINE_ITEMS)
+                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                    try:
+                        WebDriverWait(driver, min(SCROLL_WAIT_TIMEOUT, remaining), poll_frequency=0.2).until(
+                            lambda d: d.execute_script(_JS_MORE_TIMELINE_ITEMS, prev_count)
+                        )
+                    except TimeoutException:
+                        break # Nothing more loaded
 
-            # Wait specifically for tweet elements to appear
-            tweet_selector = "div.timeline-item" # Selector might need updating
-            logger.debug(f"[Scrape Profile] Waiting for tweet elements using selector: '{tweet_selector}'")
-            try:
-                 WebDriverWait(self.driver, 15).until(
-                     EC.presence_of_element_located((By.CSS_SELECTOR, tweet_selector))
-                 )
-                 logger.debug(f"[Scrape Profile] Tweet elements ('{tweet_selector}') found for handle '{handle}'.")
-            except TimeoutException:
-                 logger.error(f"[Scrape Profile] Timeout waiting for tweets ('{tweet_selector}') to load for user {handle} on {profile_url}")
-                 # Optionally take a screenshot on timeout
-                 # self.save_screenshot(f"timeout_{handle}.png")
-                 return [] # Return empty list if tweets don't load
-
-            # Get page source after loading
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-
-            # Find tweet containers
-            tweet_elements = soup.select(tweet_selector)
-            logger.info(f"[Scrape Profile] Found {len(tweet_elements)} potential tweet elements for {handle}.")
-
-            if not tweet_elements:
-                logger.warning(f"[Scrape Profile] No tweet elements found using selector '{tweet_selector}' for {handle} after waiting.")
+                # Wait specifically for tweet elements to appear
+                tweet_selector = _SEL_TIMELINE_ITEM
+                logger.debug(f"[Scrape Profile] Waiting for tweet elements using selector: '{tweet_selector}'")
+                try:
+                     WebDriverWait(driver, 15).until(
+                         EC.presence_of_element_located((By.CSS_SELECTOR, tweet_selector))
+                     )
+                     logger.debug(f"[Scrape Profile] Tweet elements ('{tweet_selector}') found for handle '{handle}'.")
+                except TimeoutException:
+                     logger.error(f"[Scrape Profile] Timeout waiting for tweets ('{tweet_selector}') to load for user {handle} on {profile_url}")
+                     # Optionally take a screenshot on timeout
+                     # self.save_screenshot(f"timeout_{handle}.png")
+                     return [] # Return empty list if tweets don't load
+
+                # Get page source after loading
+                page_source = driver.page_source
+
+            # Parse with the same timeline parser as the HTTP path, so both return full tweet records
+            tweets = self._parse_timeline_html(page_source, handle)
+            if not tweets:
+                logger.warning(f"[Scrape Profile] No tweets parsed using selector '{tweet_selector}' for {handle} after waiting.")
                 # Optionally take a screenshot if no elements found
                 # self.save_screenshot(f"no_elements_{handle}.png")
                 return []
-            
-            # Ensure list is not empty before accessing index 0
-            if tweet_elements:
-                 try:
-                     first_tweet_html = tweet_elements[0].prettify()
-                     logger.debug(f"[Scrape Profile] Raw HTML of first tweet element found for '{handle}':\n{first_tweet_html}")
-                 except IndexError:
-                     logger.debug("[Scrape Profile] tweet_elements list was unexpectedly empty after check.")
-                 except Exception as log_err:
-                     logger.error(f"[Scrape Profile] Error logging first tweet HTML: {log_err}")
-
-            tweets_data = []
-            for tweet_element in tweet_elements:
-                try:
-                    # --- PARSING LOGIC --- 
-                    # ... (existing parsing for content, date, stats, url etc.) ...
-                    
-                    # Ensure data extraction is robust
-                    content_element = tweet_element.select_one('.tweet-content')
-                    content = content_element.text.strip() if content_element else None
-                    
-                    # ... (other fields) ...
-                    
-                    if content: # Basic validation - skip if no content found
-                       tweets_data.append({
-                           # ... (append extracted data) ...
-                       })
-                       
-                except Exception as parse_err:
-                    logger.error(f"Error parsing individual tweet element for {handle}: {parse_err}", exc_info=False) # Less verbose logging for individual errors
-                    # Log the problematic element HTML for debugging
-                    logger.debug(f"Problematic tweet element HTML:\n{tweet_element.prettify()}")
-                    continue # Skip this tweet on error
-                    
-            logger.info(f"[Scrape Profile] Successfully parsed {len(tweets_data)} tweets for {handle}.")
-            return tweets_data
+
+            logger.info(f"[Scrape Profile] Successfully parsed {len(tweets)} tweets for {handle}.")
+            return [tweet.to_dict() for tweet in tweets]
 
         except TimeoutException:
             logger.error(f"[Scrape Profile] Page load timeout for {profile_url}")
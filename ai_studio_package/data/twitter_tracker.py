@@ -1,4 +1,4 @@
-from .browser_manager import BrowserManager
+from .browser_manager import BrowserManager, USER_SCRAPE_CONCURRENCY
 import logging
 import asyncio
 from typing import List, Dict, Optional, Any
@@ -72,18 +72,25 @@ class TwitterTracker:
                 
             logger.info(f"Scanning {len(self.tracked_users)} users: {self.tracked_users}")
             
-            # Use asyncio.gather to run user scans concurrently
+            # Scan users concurrently; each fetches under a shared limit and
+            # processes its own tweets as soon as they arrive
+            fetch_semaphore = asyncio.Semaphore(USER_SCRAPE_CONCURRENCY)
             scan_tasks = []
             for username in self.tracked_users:
-                scan_tasks.append(self._scan_single_user(username))
+                scan_tasks.append(self._scan_single_user(username, fetch_semaphore))
             
             if scan_tasks:
                 await asyncio.gather(*scan_tasks)
                     
             logger.info("Finished Twitter scan cycle.")
             
-    async def _scan_single_user(self, username: str):
-        """Scans and processes tweets for a single user. Directly awaits the async get_user_tweets."""
+    async def _scan_single_user(self, username: str, fetch_semaphore: Optional[asyncio.Semaphore] = None):
+        """Scans and processes tweets for a single user.
+        
+        Args:
+            username: Handle to scan
+            fetch_semaphore: Optional semaphore bounding concurrent timeline fetches
+        """
         normalized_username = username.lstrip('@').strip().lower()
         logger.info(f"Checking account (normalized/lowercase): {normalized_username}")
         user_db_id = self.user_id_map.get(normalized_username)
@@ -94,9 +101,11 @@ class TwitterTracker:
         # loop = asyncio.get_running_loop() # No longer needed here
 
         try:
-            # --- Directly await the async get_user_tweets method ---
-            tweets = await self.browser_manager.get_user_tweets(username)
-            # --- End await ---
+            if fetch_semaphore is None:
+                tweets = await self.browser_manager.get_user_tweets(username)
+            else:
+                async with fetch_semaphore:
+                    tweets = await self.browser_manager.get_user_tweets(username)
             
             if tweets:
                 logger.info(f"Found {len(tweets)} tweets for {username}. Processing...")
@@ -13,10 +13,13 @@ import json
 import logging
 import os
 import sqlite3
+import threading
 import uuid
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Any, Union
 
 # Third-party imports
 import numpy as np
@@ -40,13 +43,22 @@ logger = logging.getLogger(__name__)
 DB_PATH = os.path.join("memory", "memory.sqlite")
 VECTOR_DB_PATH = os.path.join("memory", "vectors.sqlite")
 
-# It's better to load the model once. We can make this more robust later.
-# This line should ideally be outside the function, maybe near the top after imports.
-# We'll place it here for now for simplicity in the edit.
 embedding_model_name = 'all-MiniLM-L6-v2' 
-embedding_model = SentenceTransformer(embedding_model_name)
 embedding_dimensions = 384 # Specify dimensions for MiniLM-L6-v2
 
+@lru_cache(maxsize=1)
+def get_embedding_model() -> SentenceTransformer:
+    """
+    Get the sentence-transformer model, loading it once on first use.
+    
+    Loading is deferred so processes that only query the database (such as
+    the critic's worker processes) never load torch weights.
+    
+    Returns:
+        SentenceTransformer: The shared embedding model
+    """
+    return SentenceTransformer(embedding_model_name)
+
 # Import the vector adapter
 from ai_studio_package.infra.vector_adapter import (
     search_similar_nodes_faiss, 
@@ -70,11 +82,61 @@ def get_db_connection():
     # Enable Write-Ahead Logging for potentially better concurrency
     try:
         conn.execute("PRAGMA journal_mode=WAL;") # Re-enable WAL mode
+        # In WAL mode NORMAL only syncs at checkpoints, not on every commit
+        conn.execute("PRAGMA synchronous=NORMAL;")
         logger.info("SQLite journal_mode set to WAL.")
     except Exception as e:
         logger.warning(f"Could not set journal_mode to WAL: {e}")
     return conn
 
+# Per-thread cached connections (see get_shared_db_connection)
+_thread_local = threading.local()
+
+def get_shared_db_connection() -> sqlite3.Connection:
+    """
+    Get this thread's cached connection to the SQLite database, opening it on first use.
+    
+    Reusing the connection keeps SQLite's prepared statement cache warm across calls.
+    Callers must not close it; use close_db_connection() at shutdown instead.
+    
+    Returns:
+        sqlite3.Connection: Database connection object
+    """
+    conn = getattr(_thread_local, 'conn', None)
+    if conn is None:
+        conn = get_db_connection()
+        _thread_local.conn = conn
+    return conn
+
+def close_db_connection() -> None:
+    """Close this thread's cached connection, if one is open."""
+    conn = getattr(_thread_local, 'conn', None)
+    if conn is not None:
+        _thread_local.conn = None
+        conn.close()
+
+@contextmanager
+def batched_node_writes(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """
+    Group several writes on conn into one transaction.
+    
+    Takes the write lock up front (BEGIN IMMEDIATE), commits on exit and
+    rolls back if the block raises.
+    
+    Args:
+        conn (sqlite3.Connection): Connection to write through
+        
+    Yields:
+        sqlite3.Connection: The same connection
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except Exception:
+        conn.rollback()
+        raise
+    conn.commit()
+
 def get_vector_db_connection():
     """
     Get a connection to the vector SQLite database.
@@ -863,18 +925,25 @@ def export_data(table: str, output_file: str) -> int:
 
 # Memory Node Functions
 
-def create_memory_node(node: Dict[str, Any]) -> Optional[str]:
+def create_memory_node(node: Dict[str, Any], conn: Optional[sqlite3.Connection] = None) -> Optional[str]:
     """
     Create a new memory node.
     
     Args:
         node (dict): Node data
+        conn (sqlite3.Connection, optional): Connection with an open batch transaction
+            (see batched_node_writes). When given, the insert is neither committed nor
+            embedded here; the caller commits and generates embeddings for the batch.
         
     Returns:
-        Optional[str]: The ID of the created node, or None if failed.
+        Optional[str]: The ID of the created node, or None if failed. In batched mode
+            None is also returned when a node with that ID already exists, so the
+            caller does not embed it a second time.
     """
+    batched = conn is not None
     try:
-        conn = get_db_connection()
+        if not batched:
+            conn = get_db_connection()
         cursor = conn.cursor()
         
         # Generate ID if not provided
@@ -912,6 +981,12 @@ def create_memory_node(node: Dict[str, Any]) -> Optional[str]:
         # Check if the row was actually inserted (or ignored)
         row_inserted = cursor.rowcount > 0
         
+        if batched:
+            if not row_inserted:
+                logger.debug(f"Memory node {node['id']} already existed. Insertion ignored.")
+                return None
+            return node['id']
+        
         conn.commit()
         conn.close()
         
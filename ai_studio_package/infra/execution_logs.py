@@ -66,7 +66,25 @@ def init_execution_logs_table():
         CREATE INDEX IF NOT EXISTS idx_execution_logs_status 
         ON execution_logs(status)
         ''')
-        
+
+        # Create indexes for recent-window scans (ORDER BY start_time DESC),
+        # with and without a task filter
+        cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_execution_logs_task_start_time
+        ON execution_logs(task, start_time DESC)
+        ''')
+
+        cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_execution_logs_start_time
+        ON execution_logs(start_time DESC)
+        ''')
+
+        # Create partial index for error lookups by time
+        cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_execution_logs_errors
+        ON execution_logs(start_time) WHERE status = 'error'
+        ''')
+
         conn.commit()
         logger.info("Execution logs table initialized successfully")
         
@@ -363,31 +381,24 @@ def get_execution_stats(
             query_base += " AND end_time <= ?"
             params.append(end_date)
         
-        # Total count
-        cursor.execute(f"SELECT COUNT(*) {query_base}", params)
-        stats["total_count"] = cursor.fetchone()[0]
-        
-        # Success count
-        cursor.execute(f"SELECT COUNT(*) {query_base} AND status = 'success'", params)
-        stats["success_count"] = cursor.fetchone()[0]
+        # Compute all statistics in a single pass over the matching rows
+        # (AVG ignores NULL quality values)
+        cursor.execute(f"""
+        SELECT COUNT(*),
+               SUM(status = 'success'),
+               SUM(status = 'error'),
+               AVG(latency),
+               SUM(cost),
+               AVG(quality)
+        {query_base}
+        """, params)
+        total_count, success_count, error_count, avg_latency, total_cost, avg_quality = cursor.fetchone()
         
-        # Error count
-        cursor.execute(f"SELECT COUNT(*) {query_base} AND status = 'error'", params)
-        stats["error_count"] = cursor.fetchone()[0]
-        
-        # Average latency
-        cursor.execute(f"SELECT AVG(latency) {query_base}", params)
-        avg_latency = cursor.fetchone()[0]
+        stats["total_count"] = total_count
+        stats["success_count"] = success_count if success_count else 0
+        stats["error_count"] = error_count if error_count else 0
         stats["avg_latency"] = avg_latency if avg_latency else 0
-        
-        # Total cost
-        cursor.execute(f"SELECT SUM(cost) {query_base}", params)
-        total_cost = cursor.fetchone()[0]
         stats["total_cost"] = total_cost if total_cost else 0
-        
-        # Average quality
-        cursor.execute(f"SELECT AVG(quality) {query_base} AND quality IS NOT NULL", params)
-        avg_quality = cursor.fetchone()[0]
         stats["avg_quality"] = avg_quality if avg_quality else 0
         
         return stats
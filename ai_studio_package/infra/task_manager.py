@@ -21,6 +21,9 @@ from ai_studio_package.infra.db_enhanced import get_db_connection, create_memory
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of queued embedding tasks encoded together in one model call
+EMBEDDING_BATCH_SIZE = 32
+
 # Global task queue
 _task_queue = Queue()
 _stop_event = Event()
@@ -97,44 +100,54 @@ def _worker_loop():
     
     while _is_running:
         try:
-            # Get task with timeout
-            task = _task_queue.get(timeout=1.0)
+            # Wait for a task, then drain whatever else is queued (up to a batch)
+            tasks = [_task_queue.get(timeout=1.0)]
+            while len(tasks) < EMBEDDING_BATCH_SIZE:
+                try:
+                    tasks.append(_task_queue.get_nowait())
+                except Empty:
+                    break
             
             try:
-                # Extract task data
-                node_id = task.get('node_id')
-                text = task.get('text')
-                metadata = task.get('metadata', {})
-                
                 # Validate task data
-                if not node_id:
-                    logger.error("Task missing node_id")
-                    continue
-                if not text:
-                    logger.error(f"Task for node {node_id} missing text content")
+                pending = []
+                for task in tasks:
+                    node_id = task.get('node_id')
+                    text = task.get('text')
+                    if not node_id:
+                        logger.error("Task missing node_id")
+                        continue
+                    if not text:
+                        logger.error(f"Task for node {node_id} missing text content")
+                        continue
+                    logger.debug(f"Text length: {len(text)}, metadata: {task.get('metadata', {})}")
+                    pending.append((node_id, text))
+                
+                if not pending:
                     continue
                 
                 # Log task processing
-                logger.info(f"Processing embedding task for node {node_id}")
-                logger.debug(f"Text length: {len(text)}, metadata: {metadata}")
+                logger.info(f"Processing embedding tasks for {len(pending)} nodes")
                 
                 # Import here to avoid circular imports
-                from ai_studio_package.infra.vector_adapter import generate_embedding_for_node_faiss
+                from ai_studio_package.infra.vector_adapter import generate_embeddings_for_nodes_faiss
                 
-                # Generate embedding
-                success = generate_embedding_for_node_faiss(node_id, text)
+                # Generate all embeddings with one batched model call and one index save
+                results = generate_embeddings_for_nodes_faiss(pending)
                 
-                if success:
-                    logger.info(f"Successfully generated embedding for node {node_id}")
-                else:
-                    logger.error(f"Failed to generate embedding for node {node_id}")
+                for node_id, success in results.items():
+                    if success:
+                        logger.info(f"Successfully generated embedding for node {node_id}")
+                    else:
+                        logger.error(f"Failed to generate embedding for node {node_id}")
                     
             except Exception as e:
-                logger.error(f"Error processing task for node {node_id if 'node_id' in locals() else 'unknown'}: {str(e)}")
+                logger.error(f"Error processing embedding tasks: {str(e)}")
                 logger.debug("Full error details:", exc_info=True)
                 
             finally:
-                _task_queue.task_done()
+                for _ in tasks:
+                    _task_queue.task_done()
                 
         except Empty:
             # No tasks available, continue waiting
@@ -168,6 +181,10 @@ def shutdown_task_manager():
         _worker_thread = None
     logger.info("Embedding task worker thread stopped")
 
+def is_task_manager_running() -> bool:
+    """Return True if the worker thread is running and accepting embedding tasks."""
+    return _is_running and _worker_thread is not None and _worker_thread.is_alive()
+
 def create_embedding_task(node_id: str, text: str, metadata: dict = None) -> bool:
     """
     Create and queue a task to generate embeddings for a node.
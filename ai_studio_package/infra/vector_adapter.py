@@ -257,6 +257,69 @@ def generate_embedding_for_node_faiss(node_id: str, text: str = None) -> bool:
         traceback.print_exc()
         return False
 
+def generate_embeddings_for_nodes_faiss(nodes: List[Tuple[str, str]], batch_size: int = 32) -> Dict[str, bool]:
+    """
+    Generate and store embeddings for several memory nodes with one batched model call.
+    
+    Args:
+        nodes (List[Tuple[str, str]]): (node_id, text) pairs to embed.
+        batch_size (int): Batch size passed to the embedding model.
+        
+    Returns:
+        Dict[str, bool]: Mapping of node ID to whether its embedding was stored.
+    """
+    results = {node_id: False for node_id, _ in nodes}
+    if not nodes:
+        return results
+    
+    try:
+        vector_store = get_vector_store()
+        
+        node_ids = [node_id for node_id, _ in nodes]
+        texts = [text if isinstance(text, str) else str(text) for _, text in nodes]
+        
+        logger.debug(f"Generating embeddings for {len(texts)} nodes in batches of {batch_size}")
+        embeddings = vector_store.model.encode(texts, batch_size=batch_size, convert_to_numpy=True)
+        if not isinstance(embeddings, np.ndarray):
+            embeddings = np.array(embeddings)
+        
+        now = int(time.time())
+        for node_id, text, embedding in zip(node_ids, texts, embeddings):
+            metadata = {
+                'id': node_id,
+                'content': text[:1000],  # Store truncated content
+                'created_at': now,
+                'updated_at': now
+            }
+            if vector_store.add_embedding(embedding, metadata):
+                results[node_id] = True
+            else:
+                logger.error(f"Failed to add embedding to vector store for node {node_id}")
+        
+        stored_ids = [node_id for node_id, ok in results.items() if ok]
+        if not stored_ids:
+            return results
+            
+        vector_store.save()  # Save once for the whole batch
+        
+        # Update has_embedding flags in database
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.executemany(
+            "UPDATE memory_nodes SET has_embedding = 1 WHERE id = ?",
+            [(node_id,) for node_id in stored_ids]
+        )
+        conn.commit()
+        conn.close()
+        
+        logger.info(f"Successfully added {len(stored_ids)}/{len(nodes)} embeddings to FAISS")
+        return results
+        
+    except Exception as e:
+        logger.error(f"Error in generate_embeddings_for_nodes_faiss: {e}")
+        traceback.print_exc()
+        return results
+
 def create_node_with_embedding(node_data: Dict[str, Any], async_embedding: bool = True) -> Optional[str]:
     """
     Create a new memory node and generate its embedding.
@@ -301,6 +364,74 @@ def create_node_with_embedding(node_data: Dict[str, Any], async_embedding: bool
         traceback.print_exc()
         return None
 
+def create_nodes_with_embeddings(node_data_list: List[Dict[str, Any]]) -> List[Optional[str]]:
+    """
+    Create several memory nodes in one transaction and queue their embeddings.
+
+    Embeddings are handed to the task manager's background worker, which encodes
+    queued nodes in batches, so this returns without waiting on the model. They
+    are only generated inline (in one batched call) when the task manager is not
+    running.
+
+    Args:
+        node_data_list (List[Dict[str, Any]]): Node data for each node to create
+
+    Returns:
+        List[Optional[str]]: Node ID for each input (None where creation failed or
+            the node already existed), in input order. A node whose embedding fails
+            is still returned.
+    """
+    try:
+        # Import here to avoid circular imports
+        from ai_studio_package.infra.db_enhanced import (
+            batched_node_writes,
+            create_memory_node,
+            get_db_connection as get_memory_db_connection
+        )
+        from ai_studio_package.infra.task_manager import create_embedding_task, is_task_manager_running
+
+        node_ids = []
+        pending = []
+        conn = get_memory_db_connection()
+        try:
+            # Insert all nodes in one transaction
+            with batched_node_writes(conn):
+                for node_data in node_data_list:
+                    node_id = create_memory_node(node_data, conn=conn)
+                    if not node_id:
+                        logger.warning(f"Memory node {node_data.get('id', '')} not created (failed or already exists)")
+                    else:
+                        pending.append((node_id, node_data))
+                    node_ids.append(node_id or None)
+        finally:
+            conn.close()
+
+        # Queue each created node for the background worker; anything it cannot
+        # take is embedded here with one batched model call
+        inline = []
+        task_manager_running = is_task_manager_running()
+        for node_id, node_data in pending:
+            queued = task_manager_running and create_embedding_task(
+                node_id=node_id,
+                text=node_data['content'],
+                metadata={'node_type': node_data.get('type', 'unknown')}
+            )
+            if not queued:
+                inline.append((node_id, node_data['content']))
+
+        if inline:
+            embedded = generate_embeddings_for_nodes_faiss(inline)
+            failed = [node_id for node_id, ok in embedded.items() if not ok]
+            if failed:
+                logger.error(f"Failed to generate embeddings for nodes: {failed}")
+
+        return node_ids
+
+    except Exception as e:
+        logger.error(f"Error in create_nodes_with_embeddings: {e}")
+        traceback.print_exc()
+        return [None] * len(node_data_list)
+
 def search_similar_nodes_faiss(
     query_text: str,
     limit: int = 10,
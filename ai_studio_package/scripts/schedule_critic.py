@@ -28,7 +28,8 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Import our Critic Agent
-from ai_studio_package.agents.critic_agent import run_critic
+from ai_studio_package.agents.critic_agent import run_critic, run_critic_many
+from ai_studio_package.infra.db_enhanced import close_db_connection
 
 def run_scheduled_critic():
     """Run the Critic Agent on a schedule"""
@@ -54,13 +55,13 @@ def run_scheduled_critic():
             "summarizeContent"
         ]
         
-        for task in priority_tasks:
-            task_result = run_critic(
-                task=task,
-                limit=50,
-                days=1,
-                min_entries=3  # Lower threshold for specific tasks
-            )
+        task_results = run_critic_many(
+            priority_tasks,
+            limit=50,
+            days=1,
+            min_entries=3  # Lower threshold for specific tasks
+        )
+        for task, task_result in zip(priority_tasks, task_results):
             logger.info(f"Critic Agent run complete for task '{task}': {task_result['status']}")
             
         return True
@@ -102,6 +103,8 @@ def main():
     except Exception as e:
         logger.error(f"Error in scheduler loop: {e}", exc_info=True)
         return 1
+    finally:
+        close_db_connection()
     
     return 0
 
@@ -43,6 +43,11 @@ MIN_LIKES_FOR_COMMENT_FETCH = 25
 # Add other thresholds if needed (retweets?)
 # TODO: Consider moving these to .env or a config file
 
+# --- Scan Pipeline Constants ---
+FETCH_WORKERS = 1  # Scraping shares one Selenium driver, so more fetchers only queue on its lock
+PROCESS_WORKERS = 4
+TWEET_QUEUE_MAXSIZE = 1000
+
 class TwitterTracker:
     """
     Twitter Tracker for AI Studio.
@@ -78,10 +83,13 @@ class TwitterTracker:
         
         # Regex patterns
         self.contract_regex = r"0x[a-fA-F0-9]{40}"
+        self._contract_re = re.compile(self.contract_regex)
+        self._keyword_needles = [(k, k.lower()) for k in self.keywords]
         
         # State tracking
         self.last_tweet_ids = {}  # account -> tweet_id
         self.driver = None
+        self._driver_lock = asyncio.Lock()  # Serializes use of the shared Selenium driver
         self.last_check_time = None
         
         # Rate limiting
@@ -404,6 +412,7 @@ class TwitterTracker:
     def update_keywords(self, keywords: List[str]):
         """Dynamically update the list of keywords to track."""
         self.keywords = [k.strip() for k in keywords if k.strip()]
+        self._keyword_needles = [(k, k.lower()) for k in self.keywords]
         logger.info(f"Updated Twitter keywords to track: {self.keywords}")
     
     def process_tweet(self, tweet: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -419,8 +428,8 @@ class TwitterTracker:
         detected_items = []
         tweet_text = tweet.get('content', '')
         
-        # Check for contract addresses
-        contract_matches = re.findall(self.contract_regex, tweet_text)
+        # Check for contract addresses (cheap substring test before the regex engine)
+        contract_matches = self._contract_re.findall(tweet_text) if "0x" in tweet_text else ()
         for contract in contract_matches:
             logger.info(f"Found contract {contract} in tweet {tweet.get('id')}")
             
@@ -442,8 +451,9 @@ class TwitterTracker:
             })
         
         # Check for keywords
-        for keyword in self.keywords:
-            if keyword.lower() in tweet_text.lower():
+        lower_text = tweet_text.lower()
+        for keyword, needle in self._keyword_needles:
+            if needle in lower_text:
                 logger.info(f"Found keyword '{keyword}' in tweet {tweet.get('id')}")
                 
                 detected_items.append({
@@ -460,6 +470,10 @@ class TwitterTracker:
         """
         Scan Twitter accounts for new tweets and store them as memory nodes.
         Designed to be run periodically.
+
+        Fetching and processing are decoupled through a bounded queue: fetcher
+        tasks scrape accounts and enqueue raw tweets while processor tasks store
+        them and run pattern detection, so slow DB work never stalls scraping.
         """
         logger.info("Starting Twitter scan cycle...")
         
@@ -478,190 +492,227 @@ class TwitterTracker:
              logger.error(f"Error getting DB connection: {db_err}")
              return # Cannot proceed without DB
         
-        all_processed_items = [] # To collect items from process_tweet
+        accounts_q: asyncio.Queue = asyncio.Queue()
+        for account in self.twitter_accounts:
+            accounts_q.put_nowait(account)
+        tweets_q: asyncio.Queue = asyncio.Queue(maxsize=TWEET_QUEUE_MAXSIZE)
         
+        # Per-scan bookkeeping shared by the processor tasks
+        scan_state = {
+            'processed_items': [], # To collect items from process_tweet
+            'stored': 0,
+            'skipped': 0,
+            'errors': 0
+        }
+        
+        processors = []
         try:
-            for account in self.twitter_accounts:
-                account_lower = account.lower() # Use lowercase for consistency internally
-                logger.info(f"Checking account: {account} ({account_lower})")
-                
-                # Apply rate limiting
-                if not self._should_check_account(account_lower):
-                    logger.info(f"Skipping {account_lower} due to rate limiting")
-                    continue
-                
-                try:
-                    # Fetch raw tweet data from BrowserManager
-                    # Returns list of dicts: {'id', 'content', 'timestamp_iso', 'stats': {'replies', 'likes', ...}, 'url'}
-                    new_tweets_raw = await self.check_account(account_lower)
-                    logger.info(f"Found {len(new_tweets_raw)} raw tweets for {account}. Processing...")
-
-                    if not new_tweets_raw:
-                        logger.info(f"No raw tweets returned from BrowserManager for {account}.")
-                        self._update_check_interval(account_lower, 0) # Update interval even if no tweets
-                        continue
-
-                    # --- TEMPORARY DEBUG: Process first few regardless of DB status --- 
-                    processed_for_debug_count = 0
-                    max_to_process_for_debug = 3 
-                    # --- END TEMP DEBUG --- 
-
-                    # Get existing IDs from DB *once* for efficiency
-                    tweet_ids_to_check = [t.get('id') for t in new_tweets_raw if t.get('id')]
-                    # Helper function assumed to exist or needs to be created:
-                    # def get_existing_tweet_node_ids(conn, tweet_ids): 
-                    #    placeholders = ','join('?' * len(tweet_ids))
-                    #    node_ids = [f'tweet_{tid}' for tid in tweet_ids]
-                    #    cursor = conn.execute(f"SELECT id FROM memory_nodes WHERE id IN ({placeholders})", node_ids)
-                    #    return {row['id'] for row in cursor.fetchall()} 
-                    # For now, we will check individually, which is less efficient
-                    # existing_tweet_node_ids = set(get_existing_tweet_node_ids(conn, tweet_ids_to_check))
-                    # logger.debug(f"Checked {len(tweet_ids_to_check)} tweet IDs against DB for {account}.")
-                    
-                    stored_count = 0
-                    skipped_count = 0
-                    error_count = 0
-                    
-                    for tweet_data_raw in new_tweets_raw:
-                        tweet_id_numeric = tweet_data_raw.get('id')
-                        if not tweet_id_numeric:
-                            logger.warning("Skipping tweet due to missing ID from BrowserManager.")
-                            error_count += 1
-                            continue
-                            
-                        tweet_node_id = f"tweet_{tweet_id_numeric}"
-                        
-                        # --- Check if node exists (less efficient than bulk check) ---
-                        existing_node = get_memory_node(tweet_node_id) # Assumes get_memory_node handles its own connection/cursor
-                        node_exists_in_db = existing_node is not None
-                        # --- End Check ---
-                        
-                        # --- TEMPORARY DEBUG: Check if processing is forced --- 
-                        force_process_for_debug = processed_for_debug_count < max_to_process_for_debug
-                        # --- END TEMP DEBUG --- 
-                        
-                        # Original check: Skip if tweet already exists AND we are not forcing debug processing
-                        if node_exists_in_db and not force_process_for_debug:
-                            skipped_count += 1
-                            continue # Skip this tweet if already in DB and not forced
-
-                        # --- If we reach here, we process the tweet (either new or forced for debug) ---
-                        processed_for_debug_count += 1 # Increment debug counter if processed
-
-                        # 1. Prepare data for memory node (map from BrowserManager format)
-                        tweet_stats = tweet_data_raw.get('stats', {})
-                        timestamp_iso = tweet_data_raw.get('timestamp_iso')
-                        created_at_timestamp = int(time.time()) # Default to current time as int
-                        if timestamp_iso:
-                            try:
-                                dt_obj = datetime.fromisoformat(timestamp_iso.replace('Z', '+00:00'))
-                                created_at_timestamp = int(dt_obj.timestamp())
-                            except (ValueError, TypeError) as ts_err:
-                                logger.warning(f"Could not parse ISO timestamp '{timestamp_iso}': {ts_err}. Using current time.")
-
-                        # Define node_data dictionary correctly
-                        node_data = {
-                            'id': tweet_node_id,
-                            'type': 'tweet',
-                            'content': tweet_data_raw.get('content', ''),
-                            'tags': ['tweet', account],
-                            'created_at': created_at_timestamp,
-                            'source_id': tweet_id_numeric,
-                            'source_type': 'twitter_tweet',
-                            'metadata': {
-                                'tweet_id': tweet_id_numeric,
-                                'timestamp_iso': timestamp_iso,
-                                'url': tweet_data_raw.get('url'),
-                                'platform': 'twitter',
-                                'author': account,
-                                'scraped_at': datetime.now().isoformat(),
-                                'replies': tweet_stats.get('replies', 0),
-                                'likes': tweet_stats.get('likes', 0),
-                                'retweets': tweet_stats.get('retweets', 0),
-                                'quotes': tweet_stats.get('quotes', 0)
-                            }
-                        }
-
-                        # Log before storing (only if it wasn't skipped)
-                        logger.info(f"Processing tweet {tweet_node_id} (Exists: {node_exists_in_db}, Forced: {force_process_for_debug})")
-                        
-                        # 2. Store/Update the original tweet as a memory node
-                        # Using create_memory_node which handles its own connection implicitly
-                        # We might need UPDATE logic if we want to update existing nodes when force_process_for_debug is True
-                        created_node_id = None
-                        if not node_exists_in_db:
-                             created_node_id = create_memory_node(node_data) 
-                        
-                        # Proceed if node was newly created OR if it existed but we forced processing
-                        if created_node_id or (node_exists_in_db and force_process_for_debug):
-                            if created_node_id:
-                                stored_count += 1
-                                logger.info(f"Stored NEW tweet {tweet_node_id} as memory node {created_node_id}")
-                            else:
-                                # If forced and already exists, log differently or update node if needed
-                                logger.info(f"Re-processing EXISTING tweet {tweet_node_id} for reply check.")
-                                # Optional: Update existing node metadata if desired
-                                # from ai_studio_package.infra.db_enhanced import update_memory_node 
-                                # update_memory_node({'id': tweet_node_id, 'metadata': node_data['metadata']}) # Example update
-                                pass
-
-                            # 3. Process tweet for keywords/contracts (existing logic)
-                            processed_items = self.process_tweet(node_data)
-                            all_processed_items.extend(processed_items)
-                            
-                            # 4. Check for high traction and fetch replies if needed
-                            replies = tweet_stats.get('replies', 0)
-                            likes = tweet_stats.get('likes', 0)
-                            
-                            # --- Log Engagement Data Before Check --- 
-                            logger.debug(f"[Threshold Check] Tweet {tweet_node_id}: Checking traction with Replies={replies}, Likes={likes}")
-                            # --- End Log --- 
-                            
-                            if (replies >= self.min_replies_for_comment_fetch or 
-                                likes >= self.min_likes_for_comment_fetch):
-                                logger.info(f"High traction detected for tweet {tweet_node_id} (Replies: {replies}, Likes: {likes}). Fetching replies...")
-                                # Pass the necessary data (URL, Node ID) from node_data
-                                fetch_data = {
-                                    'url': node_data['metadata']['url'],
-                                    'id': node_data['id'] # Pass the node ID (e.g., tweet_123)
-                                }
-                            await self._fetch_and_process_replies(fetch_data) 
-                            
-                        elif not created_node_id and not node_exists_in_db:
-                             # This case means create_memory_node failed for a non-existing node
-                            logger.error(f"Failed to store NEW tweet {tweet_node_id} as memory node.")
-                            error_count += 1
-                            
-                    logger.info(f"Finished processing for {account}. Inserted: {stored_count}, Skipped (Already Existed): {skipped_count}, Errors: {error_count}")
-                    
-                    # Update overall check interval for the account based on *raw* tweets found
-                    self._update_check_interval(account_lower, len(new_tweets_raw))
-                    
-                    # Add delay between accounts
-                    await asyncio.sleep(random.uniform(3, 7)) # Use async sleep
-
-                except Exception as e:
-                    logger.error(f"Error processing account {account}: {e}", exc_info=True)
-                    # Continue to the next account even if one fails
+            async with asyncio.TaskGroup() as fetchers_group:
+                processors = [
+                    asyncio.create_task(self._process_worker(tweets_q, scan_state))
+                    for _ in range(PROCESS_WORKERS)
+                ]
+                for _ in range(FETCH_WORKERS):
+                    fetchers_group.create_task(self._fetch_worker(accounts_q, tweets_q))
+            
+            # All fetchers are done; one sentinel per processor ends the pipeline
+            for _ in processors:
+                await tweets_q.put(None)
+            await asyncio.gather(*processors)
+            
+            logger.info(f"Finished processing tweets. Inserted: {scan_state['stored']}, Skipped (Already Existed): {scan_state['skipped']}, Errors: {scan_state['errors']}")
 
             # --- Optional: Process all detected items after scanning all accounts ---
-            # logger.info(f"Processing {len(all_processed_items)} detected items (keywords/contracts)...")
-            # for item in all_processed_items:
+            # logger.info(f"Processing {len(scan_state['processed_items'])} detected items (keywords/contracts)...")
+            # for item in scan_state['processed_items']:
             #     # Handle contracts, keywords etc.
             #     pass
             
         except Exception as e:
             logger.error(f"Unexpected error during Twitter scan cycle: {e}", exc_info=True)
         finally:
+            for processor in processors:
+                if not processor.done():
+                    processor.cancel()
             if conn: 
                 conn.close()
                 logger.info("Closed main DB connection for Twitter scan cycle.")
                 
         logger.info("Twitter scan cycle finished.")
+
+    async def _fetch_worker(self, accounts_q: asyncio.Queue, tweets_q: asyncio.Queue) -> None:
+        """
+        Fetcher task: scrape queued accounts and enqueue their raw tweets.
+        
+        Args:
+            accounts_q (asyncio.Queue): Accounts still to be checked this cycle
+            tweets_q (asyncio.Queue): Queue of (account, raw tweet) for processors
+        """
+        while True:
+            try:
+                account = accounts_q.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            
+            account_lower = account.lower() # Use lowercase for consistency internally
+            logger.info(f"Checking account: {account} ({account_lower})")
+            
+            # Apply rate limiting
+            if not self._should_check_account(account_lower):
+                logger.info(f"Skipping {account_lower} due to rate limiting")
+                continue
+            
+            try:
+                # The Selenium driver is shared, so scraping is serialized on it
+                # and run in a thread to keep the event loop free for processors
+                async with self._driver_lock:
+                    new_tweets_raw = await asyncio.to_thread(self.check_account, account_lower)
+                logger.info(f"Found {len(new_tweets_raw)} raw tweets for {account}. Queueing for processing...")
+
+                if not new_tweets_raw:
+                    logger.info(f"No raw tweets returned for {account}.")
+                    self._update_check_interval(account_lower, 0) # Update interval even if no tweets
+                    continue
+
+                for tweet_data_raw in new_tweets_raw:
+                    await tweets_q.put((account, tweet_data_raw))
+                
+                # Update overall check interval for the account based on *raw* tweets found
+                self._update_check_interval(account_lower, len(new_tweets_raw))
+                
+                # Add delay between accounts
+                await asyncio.sleep(random.uniform(3, 7)) # Use async sleep
+
+            except Exception as e:
+                logger.error(f"Error processing account {account}: {e}", exc_info=True)
+                # Continue to the next account even if one fails
+
+    async def _process_worker(self, tweets_q: asyncio.Queue, scan_state: Dict[str, Any]) -> None:
+        """
+        Processor task: store queued tweets and run pattern detection until a
+        None sentinel is received.
+        
+        Args:
+            tweets_q (asyncio.Queue): Queue of (account, raw tweet) from fetchers
+            scan_state (dict): Shared counters and detected items for this scan
+        """
+        while True:
+            entry = await tweets_q.get()
+            if entry is None:
+                return
+            account, tweet_data_raw = entry
+            try:
+                await self._store_and_process_tweet(account, tweet_data_raw, scan_state)
+            except Exception as e:
+                logger.error(f"Error processing tweet from {account}: {e}", exc_info=True)
+                scan_state['errors'] += 1
+
+    async def _store_and_process_tweet(self, account: str, tweet_data_raw: Dict[str, Any], scan_state: Dict[str, Any]) -> None:
+        """
+        Store a single raw tweet as a memory node, detect patterns in it and
+        fetch replies for high-traction tweets.
+        
+        Args:
+            account (str): Account the tweet was scraped from
+            tweet_data_raw (dict): Raw tweet data as returned by check_account
+            scan_state (dict): Shared counters and detected items for this scan
+        """
+        tweet_id_numeric = tweet_data_raw.get('id')
+        if not tweet_id_numeric:
+            logger.warning("Skipping tweet due to missing ID from BrowserManager.")
+            scan_state['errors'] += 1
+            return
+            
+        tweet_node_id = f"tweet_{tweet_id_numeric}"
+        
+        # --- Check if node exists (less efficient than bulk check) ---
+        # SQLite calls run in a thread so they never block the event loop (or the fetchers)
+        existing_node = await asyncio.to_thread(get_memory_node, tweet_node_id) # Assumes get_memory_node handles its own connection/cursor
+        node_exists_in_db = existing_node is not None
+        # --- End Check ---
+        
+        # Skip tweets that are already stored
+        if node_exists_in_db:
+            scan_state['skipped'] += 1
+            return
+
+        # 1. Prepare data for memory node (map from BrowserManager format)
+        tweet_stats = tweet_data_raw.get('stats', {})
+        timestamp_iso = tweet_data_raw.get('timestamp_iso')
+        created_at_timestamp = int(time.time()) # Default to current time as int
+        if timestamp_iso:
+            try:
+                dt_obj = datetime.fromisoformat(timestamp_iso.replace('Z', '+00:00'))
+                created_at_timestamp = int(dt_obj.timestamp())
+            except (ValueError, TypeError) as ts_err:
+                logger.warning(f"Could not parse ISO timestamp '{timestamp_iso}': {ts_err}. Using current time.")
+
+        # Define node_data dictionary correctly
+        node_data = {
+            'id': tweet_node_id,
+            'type': 'tweet',
+            'content': tweet_data_raw.get('content', ''),
+            'tags': ['tweet', account],
+            'created_at': created_at_timestamp,
+            'source_id': tweet_id_numeric,
+            'source_type': 'twitter_tweet',
+            'metadata': {
+                'tweet_id': tweet_id_numeric,
+                'timestamp_iso': timestamp_iso,
+                'url': tweet_data_raw.get('url'),
+                'platform': 'twitter',
+                'author': account,
+                'scraped_at': datetime.now().isoformat(),
+                'replies': tweet_stats.get('replies', 0),
+                'likes': tweet_stats.get('likes', 0),
+                'retweets': tweet_stats.get('retweets', 0),
+                'quotes': tweet_stats.get('quotes', 0)
+            }
+        }
+
+        # Log before storing (only if it wasn't skipped)
+        logger.info(f"Processing tweet {tweet_node_id}")
+        
+        # 2. Store the original tweet as a memory node
+        # Using create_memory_node which handles its own connection implicitly
+        created_node_id = await asyncio.to_thread(create_memory_node, node_data)
+        
+        if created_node_id:
+            scan_state['stored'] += 1
+            logger.info(f"Stored NEW tweet {tweet_node_id} as memory node {created_node_id}")
+
+            # 3. Process tweet for keywords/contracts (existing logic)
+            processed_items = self.process_tweet(node_data)
+            scan_state['processed_items'].extend(processed_items)
+            
+            # 4. Check for high traction and fetch replies if needed
+            replies = tweet_stats.get('replies', 0)
+            likes = tweet_stats.get('likes', 0)
+            
+            # --- Log Engagement Data Before Check --- 
+            logger.debug(f"[Threshold Check] Tweet {tweet_node_id}: Checking traction with Replies={replies}, Likes={likes}")
+            # --- End Log --- 
+            
+            if (replies >= self.min_replies_for_comment_fetch or 
+                likes >= self.min_likes_for_comment_fetch):
+                logger.info(f"High traction detected for tweet {tweet_node_id} (Replies: {replies}, Likes: {likes}). Fetching replies...")
+                # Pass the necessary data (URL, Node ID) from node_data
+                fetch_data = {
+                    'url': node_data['metadata']['url'],
+                    'id': node_data['id'] # Pass the node ID (e.g., tweet_123)
+                }
+                # Reply scraping and storage are blocking, so run them in a thread like check_account
+                async with self._driver_lock:
+                    await asyncio.to_thread(self._fetch_and_process_replies, fetch_data)
+            
+        else:
+            # create_memory_node failed for a non-existing node
+            logger.error(f"Failed to store NEW tweet {tweet_node_id} as memory node.")
+            scan_state['errors'] += 1
     
     def cleanup(self):
         """
-        Clean up resources (Selenium browser).
+        Clean up resources (Selenium browser and pooled HTTP sessions).
         """
         if self.driver:
             try:
@@ -670,6 +721,7 @@ class TwitterTracker:
             except Exception as e:
                 logger.error(f"Error quitting Selenium driver: {e}")
             logger.info("Browser closed")
+        self.burner_manager.close()
 
     async def search_users(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -745,7 +797,7 @@ class TwitterTracker:
             logger.error(f"Unexpected error during user search: {e}")
             return []
 
-    async def _fetch_and_process_replies(self, original_tweet_data: Dict[str, Any]):
+    def _fetch_and_process_replies(self, original_tweet_data: Dict[str, Any]):
         """
         Fetches replies for a high-traction tweet using Selenium/Nitter 
         and processes them.
@@ -0,0 +1,176 @@
+import pytest
+
+from ai_studio_package.data.browser_manager import BrowserManager, _parse_count, _parse_tweet_date
+
+
+@pytest.fixture
+def manager():
+    """BrowserManager used only for its parsers; no browser is started."""
+    manager = BrowserManager()
+    yield manager
+    manager.cleanup()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("0", 0),
+    ("12", 12),
+    ("1,234", 1234),
+    (" 1,234 ", 1234),
+    ("1.2K", 1200),
+    ("15k", 15000),
+    ("3.4M", 3400000),
+    ("1,500K", 1500000),
+    ("", 0),
+    (None, 0),
+    ("K", 0),
+    ("abcM", 0),
+])
+def test_parse_count(text, expected):
+    assert _parse_count(text) == expected
+
+
+@pytest.mark.parametrize("title, expected", [
+    ("Jan 5, 2024 · 3:04 PM UTC", "2024-01-05T15:04:00+00:00"),
+    ("Dec 31, 2023 · 11:59 PM UTC", "2023-12-31T23:59:00+00:00"),
+    ("Apr 14, 2025 · 12:30 AM UTC", "2025-04-14T00:30:00+00:00"),
+    ("Apr 14, 2025 · 12:30 PM UTC", "2025-04-14T12:30:00+00:00"),
+    ("Feb 30, 2024 · 1:00 PM UTC", None),
+    ("", None),
+    (None, None),
+    ("yesterday", None),
+])
+def test_parse_tweet_date(title, expected):
+    assert _parse_tweet_date(title) == expected
+
+
+@pytest.mark.parametrize("title, expected", [
+    ("Jan 5, 2024 · 15:04 UTC", "2024-01-05T15:04:00+00:00"),
+    ("05/01/2024, 15:04:09", "2024-01-05T15:04:09+00:00"),
+    ("31/12/2023, 23:59:00 UTC", "2023-12-31T23:59:00+00:00"),
+    ("2024-01-05 15:04", None),
+])
+def test_parse_tweet_date_fallback_formats(title, expected):
+    assert _parse_tweet_date(title) == expected
+
+
+RSS_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel>
+    <title>alice / @alice</title>
+    <item>
+      <title>Hello world</title>
+      <dc:creator>@alice</dc:creator>
+      <description><![CDATA[<p>Hello <a href="#">world</a></p>]]></description>
+      <pubDate>Fri, 05 Jan 2024 15:04:00 GMT</pubDate>
+      <guid>http://localhost:8080/alice/status/101#m</guid>
+      <link>http://localhost:8080/alice/status/101#m</link>
+    </item>
+    <item>
+      <title>Duplicate</title>
+      <dc:creator>@alice</dc:creator>
+      <guid>http://localhost:8080/alice/status/101#m</guid>
+      <link>http://localhost:8080/alice/status/101#m</link>
+    </item>
+    <item>
+      <title>RT by @alice: from bob</title>
+      <dc:creator>@bob</dc:creator>
+      <pubDate>Thu, 04 Jan 2024 09:00:00 GMT</pubDate>
+      <link>http://localhost:8080/bob/status/100#m</link>
+    </item>
+  </channel>
+</rss>"""
+
+
+def test_parse_rss(manager):
+    tweets = manager._parse_rss(RSS_FEED, "alice")
+
+    assert [t.id for t in tweets] == ["101", "100"]
+    first, retweet = tweets
+    assert first.url == "https://x.com/alice/status/101"
+    assert first.author == "alice"
+    assert first.content == "Hello world"
+    assert first.timestamp == "2024-01-05T15:04:00+00:00"
+    assert first.likes == 0
+    assert retweet.author == "bob"
+    assert retweet.username == "alice"
+    assert retweet.content == "RT by @alice: from bob"
+
+
+def test_parse_rss_respects_max_tweets(manager):
+    assert [t.id for t in manager._parse_rss(RSS_FEED, "alice", max_tweets=1)] == ["101"]
+
+
+@pytest.mark.parametrize("document", [
+    b"<html><body>Rate limited</body></html>",
+    b"not xml at all",
+])
+def test_parse_rss_rejects_non_feeds(manager, document):
+    assert manager._parse_rss(document, "alice") is None
+
+
+TIMELINE_ITEM = """<div class="timeline-item">
+  <a class="tweet-link" href="/{user}/status/{id}#m"></a>
+  <div class="tweet-body">
+    <div class="tweet-header">
+      <a class="username" href="/{user}" title="@{user}">@{user}</a>
+      <span class="tweet-date"><a href="/{user}/status/{id}#m" title="Jan 5, 2024 · 3:04 PM UTC">2h</a></span>
+    </div>
+    {pinned}
+    <div class="tweet-content media-body" dir="auto">Tweet <a href="#">{id}</a></div>
+    <div class="tweet-stats">
+      <span class="tweet-stat"><div class="icon-container"><span class="icon-comment"></span> 1,234</div></span>
+      <span class="tweet-stat"><div class="icon-container"><span class="icon-retweet"></span> 12</div></span>
+      <span class="tweet-stat"><div class="icon-container"><span class="icon-quote"></span> 3</div></span>
+      <span class="tweet-stat"><div class="icon-container"><span class="icon-heart"></span> 1.2K</div></span>
+    </div>
+  </div>
+</div>"""
+
+
+def timeline_page(*items: str) -> str:
+    return f'<html><body><div class="timeline-container"><div class="timeline">{"".join(items)}</div></div></body></html>'
+
+
+def timeline_item(tweet_id: int, user: str = "alice", pinned: bool = False) -> str:
+    return TIMELINE_ITEM.format(
+        user=user,
+        id=tweet_id,
+        pinned='<div class="pinned"><span>Pinned Tweet</span></div>' if pinned else '',
+    )
+
+
+def test_parse_timeline_html(manager):
+    page = timeline_page(timeline_item(99, pinned=True), timeline_item(101), timeline_item(100, user="bob"))
+
+    tweets = manager._parse_timeline_html(page, "alice")
+
+    assert [t.id for t in tweets] == ["101", "100"]
+    first = tweets[0]
+    assert first.url == "https://x.com/alice/status/101"
+    assert first.author == "alice"
+    assert first.content == "Tweet 101"
+    assert first.timestamp_str == "Jan 5, 2024 · 3:04 PM UTC"
+    assert first.timestamp == "2024-01-05T15:04:00+00:00"
+    assert (first.replies, first.retweets, first.quotes, first.likes) == (1234, 12, 3, 1200)
+    assert tweets[1].author == "bob"
+    assert tweets[1].username == "alice"
+
+
+def test_parse_timeline_html_accepts_bytes_and_limits_items(manager):
+    page = timeline_page(*(timeline_item(100 + i) for i in range(5))).encode("utf-8")
+
+    tweets = manager._parse_timeline_html(page, "alice", max_tweets=2)
+
+    assert [t.id for t in tweets] == ["100", "101"]
+
+
+def test_parse_timeline_html_empty_timeline(manager):
+    page = timeline_page('<h2 class="timeline-none">No items found</h2>')
+
+    assert manager._parse_timeline_html(page, "alice") == []
+
+
+def test_parse_timeline_html_without_container(manager):
+    page = "<html><body><h1>Instance has been rate limited.</h1></body></html>"
+
+    assert manager._parse_timeline_html(page, "alice") is None
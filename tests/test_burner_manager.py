@@ -0,0 +1,231 @@
+import asyncio
+
+import aiohttp
+import pytest
+from unittest.mock import MagicMock
+
+from tools.burner_manager import (
+    BurnerManager,
+    RETRIABLE_ASYNC_ERRORS,
+    RETRY_MAX_DELAY,
+    THROTTLE_MAX_RATE,
+    THROTTLE_MIN_RATE,
+    TokenBucket,
+)
+
+
+@pytest.fixture
+def burner(monkeypatch):
+    """BurnerManager without proxies, whose sync session records each request."""
+    monkeypatch.setenv('PROXIES', '')
+    manager = BurnerManager()
+    session = MagicMock()
+    sent_headers = []
+
+    def request(**kwargs):
+        sent_headers.append(dict(kwargs['headers']))
+        response = MagicMock()
+        response.status_code = 200
+        return response
+
+    session.request.side_effect = request
+    manager._get_requests_session = MagicMock(return_value=session)
+    manager.sent_headers = sent_headers
+    return manager
+
+
+def test_post_with_shared_headers_gets_new_idempotency_key(burner):
+    headers = {'Accept': 'application/json'}
+
+    burner.make_request("https://example.com/api", method="POST", headers=headers)
+    burner.make_request("https://example.com/api", method="POST", headers=headers)
+
+    first, second = burner.sent_headers
+    assert first['Idempotency-Key'] != second['Idempotency-Key']
+    assert headers == {'Accept': 'application/json'}
+
+
+def test_post_keeps_caller_idempotency_key(burner):
+    burner.make_request("https://example.com/api", method="POST", headers={'Idempotency-Key': 'abc'})
+
+    assert burner.sent_headers[0]['Idempotency-Key'] == 'abc'
+
+
+def test_backoff_delay_clamps_retry_after(burner):
+    assert burner._backoff_delay(0, {'Retry-After': '3600'}) == RETRY_MAX_DELAY
+    assert burner._backoff_delay(0, {'Retry-After': 'Wed, 21 Oct 2099 07:28:00 GMT'}) == RETRY_MAX_DELAY
+
+
+def test_backoff_delay_honours_short_retry_after(burner):
+    assert burner._backoff_delay(0, {'Retry-After': '5'}) == 5.0
+
+
+def test_no_sleep_after_final_attempt(burner, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr('tools.burner_manager.time.sleep', sleeps.append)
+    response = MagicMock()
+    response.status_code = 503
+    response.headers = {}
+    burner._get_requests_session.return_value.request.side_effect = None
+    burner._get_requests_session.return_value.request.return_value = response
+
+    assert burner.make_request("https://example.com/api", max_retries=3) is None
+    assert len(sleeps) == 2
+
+
+def test_success_is_credited_to_the_proxy_used(monkeypatch):
+    monkeypatch.setenv('PROXIES', '10.0.0.1:8080,10.0.0.2:8080')
+    monkeypatch.setenv('BURNER_MODE', 'true')
+    manager = BurnerManager()
+    used = []
+
+    def request(**kwargs):
+        used.append(manager.current_proxy)
+        # A concurrent request rotates the current proxy while this one is in flight
+        manager.current_proxy = next(p for p in manager.proxies if p != used[0])
+        response = MagicMock()
+        response.status_code = 200
+        return response
+
+    session = MagicMock()
+    session.request.side_effect = request
+    manager._get_requests_session = MagicMock(return_value=session)
+
+    manager.make_request("https://example.com/")
+
+    assert manager.working_proxies == {used[0]}
+    assert manager._proxy_stats[used[0]]['successes'] == 1
+
+
+def test_async_context_manager_closes_pooled_sessions(monkeypatch):
+    monkeypatch.setenv('PROXIES', '')
+
+    async def run():
+        async with BurnerManager() as manager:
+            session = manager._get_session(None)
+        return manager, session
+
+    manager, session = asyncio.run(run())
+    assert session.closed
+    assert not manager._sessions
+
+
+def test_sessions_are_not_reused_across_event_loops(monkeypatch):
+    monkeypatch.setenv('PROXIES', '')
+    manager = BurnerManager()
+
+    async def get_session():
+        return manager._get_session(None)
+
+    first = asyncio.run(get_session())
+    second = asyncio.run(get_session())
+    assert first is not second
+
+
+def test_async_request_does_not_mutate_caller_headers(monkeypatch):
+    monkeypatch.setenv('PROXIES', '')
+    manager = BurnerManager()
+    sent_headers = []
+
+    class Response:
+        status = 200
+        headers = {}
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def text(self):
+            return "ok"
+
+    def request(method, url, headers=None, **kwargs):
+        sent_headers.append(dict(headers))
+        return Response()
+
+    session = MagicMock()
+    session.request.side_effect = request
+    manager._get_session = MagicMock(return_value=session)
+    headers = {'Accept': 'application/json'}
+
+    asyncio.run(manager.make_async_request("https://example.com/", headers=headers))
+
+    assert headers == {'Accept': 'application/json'}
+    assert 'User-Agent' in sent_headers[0]
+
+
+def test_sessions_are_shared_across_user_agents(monkeypatch):
+    monkeypatch.setenv('PROXIES', '')
+
+    async def run():
+        async with BurnerManager() as manager:
+            for _ in range(5):
+                manager.get_identity()
+                manager._get_session(None)
+            return len(manager._sessions)
+
+    assert asyncio.run(run()) == 1
+
+
+@pytest.mark.parametrize("error", [
+    aiohttp.ClientOSError(104, "Connection reset by peer"),
+    aiohttp.ServerDisconnectedError(),
+])
+def test_transient_connection_errors_are_retriable(error):
+    assert isinstance(error, RETRIABLE_ASYNC_ERRORS)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic in burner_manager."""
+    now = [1000.0]
+    monkeypatch.setattr('tools.burner_manager.time.monotonic', lambda: now[0])
+    return now
+
+
+def test_token_bucket_allows_burst_then_waits(clock):
+    bucket = TokenBucket(rate=2.0, capacity=2.0)
+
+    assert bucket._reserve() == 0.0
+    assert bucket._reserve() == 0.0
+    assert bucket._reserve() == pytest.approx(0.5)
+    assert bucket._reserve() == pytest.approx(1.0)
+
+
+def test_token_bucket_refills_up_to_capacity(clock):
+    bucket = TokenBucket(rate=2.0, capacity=2.0)
+    bucket._reserve()
+    bucket._reserve()
+
+    clock[0] += 10
+    assert bucket._reserve() == 0.0
+    assert bucket._reserve() == 0.0
+    assert bucket._reserve() > 0
+
+
+def test_token_bucket_acquire_blocking_sleeps_for_the_wait(clock, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr('tools.burner_manager.time.sleep', sleeps.append)
+    bucket = TokenBucket(rate=4.0, capacity=1.0)
+
+    bucket.acquire_blocking()
+    bucket.acquire_blocking()
+
+    assert sleeps == [pytest.approx(0.25)]
+
+
+def test_token_bucket_rate_adapts_within_bounds():
+    bucket = TokenBucket(rate=1.0)
+
+    bucket.multiplicative_decrease()
+    assert bucket.rate == pytest.approx(0.5)
+    for _ in range(20):
+        bucket.multiplicative_decrease()
+    assert bucket.rate == THROTTLE_MIN_RATE
+
+    bucket.additive_increase()
+    assert bucket.rate == pytest.approx(THROTTLE_MIN_RATE + 0.1)
+    for _ in range(200):
+        bucket.additive_increase()
+    assert bucket.rate == THROTTLE_MAX_RATE
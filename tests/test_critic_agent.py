@@ -0,0 +1,137 @@
+import sqlite3
+import threading
+
+import pytest
+
+from ai_studio_package.agents import critic_agent
+from ai_studio_package.agents.critic_agent import format_analysis_report
+
+
+def analysis_result(**overrides):
+    """A successful analyze_execution_logs result, with fields overridden as needed."""
+    result = {
+        "status": "success",
+        "task": "scan_twitter",
+        "total_count": 20,
+        "success_count": 19,
+        "success_rate": 0.95,
+        "avg_latency": 1.234,
+        "p50_latency": 1.0,
+        "p95_latency": 2.5,
+        "p99_latency": 3.25,
+        "slow_count": 1,
+        "error_patterns": [{"error": "TimeoutError", "count": 1}],
+    }
+    result.update(overrides)
+    return result
+
+
+def test_format_analysis_report():
+    report = format_analysis_report(analysis_result())
+
+    assert report == (
+        "Performance Analysis for scan_twitter:\n"
+        "\n"
+        "Success Rate: 95.00% (19/20 successful)\n"
+        "Average Latency: 1.23 seconds\n"
+        "Latency Percentiles: p50 1.00s, p95 2.50s, p99 3.25s\n"
+        "Slow Executions (>2x average): 1\n"
+        "\n"
+        "Error Distribution:\n"
+        '{"TimeoutError":1}\n'
+        "\n"
+        "Recommendations:\n"
+    )
+
+
+def test_format_analysis_report_all_tasks_without_errors():
+    report = format_analysis_report(analysis_result(task=None, error_patterns=[]))
+
+    assert report.startswith("Performance Analysis for all tasks:\n")
+    assert "Error Distribution:\n{}\n" in report
+
+
+def test_format_analysis_report_recommendations():
+    report = format_analysis_report(analysis_result(
+        success_count=10,
+        success_rate=0.5,
+        avg_latency=6.0,
+        slow_count=5,
+        error_patterns=[{"error": "ConnectionError", "count": 8}, {"error": "KeyError", "count": 2}],
+    ))
+
+    recommendations = report.split("Recommendations:\n", 1)[1].splitlines()
+    assert recommendations == [
+        "- High error rate detected. Review error patterns and implement better error handling.",
+        "- High average latency. Consider optimization or caching strategies.",
+        "- Frequent latency outliers. Investigate the slowest executions for contention or cold starts.",
+        "- Frequent ConnectionError errors. Implement specific handling for this case.",
+    ]
+
+
+def test_run_critic_multi_analyzes_in_threads_and_closes_connections(monkeypatch):
+    analyzed_in = []
+    closed = []
+
+    def analyze(task, limit, days, min_entries):
+        analyzed_in.append(threading.current_thread().name)
+        return analysis_result(task=task), None
+
+    monkeypatch.setattr(critic_agent, "_analyze_for_critique", analyze)
+    monkeypatch.setattr(critic_agent, "close_db_connection", lambda: closed.append(True))
+    monkeypatch.setattr(critic_agent, "_store_critiques", lambda analyses: [a["task"] for a, _ in analyses])
+
+    results = critic_agent.run_critic_multi(["a", "b", "c"], workers=2)
+
+    assert results == ["a", "b", "c"]
+    assert all(name.startswith("critic") for name in analyzed_in)
+    assert len(closed) == 3
+
+
+@pytest.fixture
+def embedding_calls(monkeypatch):
+    """Stub critique storage and record how each critique's embedding is requested."""
+    from ai_studio_package.infra import db_enhanced, task_manager, vector_adapter
+
+    calls = []
+
+    def analyze(task, limit, days, min_entries):
+        node_data = {"id": f"critique_{task}", "type": "critique", "content": f"Critique of {task}"}
+        return analysis_result(task=task), node_data
+
+    def queue(node_id, text, metadata=None):
+        calls.append(("queued", node_id))
+        return True
+
+    def embed_inline(pending):
+        calls.append(("inline", [node_id for node_id, _ in pending]))
+        return {node_id: True for node_id, _ in pending}
+
+    monkeypatch.setattr(critic_agent, "_analyze_for_critique", analyze)
+    monkeypatch.setattr(db_enhanced, "get_db_connection", lambda: sqlite3.connect(":memory:"))
+    monkeypatch.setattr(db_enhanced, "create_memory_node", lambda node_data, conn=None: node_data["id"])
+    monkeypatch.setattr(task_manager, "create_embedding_task", queue)
+    monkeypatch.setattr(vector_adapter, "generate_embeddings_for_nodes_faiss", embed_inline)
+    return calls
+
+
+def test_run_critic_many_returns_before_embedding(embedding_calls, monkeypatch):
+    from ai_studio_package.infra import task_manager
+
+    monkeypatch.setattr(task_manager, "is_task_manager_running", lambda: True)
+
+    results = critic_agent.run_critic_many(["a", "b"])
+
+    assert [result["node_id"] for result in results] == ["critique_a", "critique_b"]
+    assert embedding_calls == [("queued", "critique_a"), ("queued", "critique_b")]
+
+
+def test_run_critic_many_embeds_inline_without_task_manager(embedding_calls, monkeypatch):
+    from ai_studio_package.infra import task_manager
+
+    monkeypatch.setattr(task_manager, "is_task_manager_running", lambda: False)
+
+    results = critic_agent.run_critic_many(["a", "b"])
+
+    assert [result["node_id"] for result in results] == ["critique_a", "critique_b"]
+    assert embedding_calls == [("inline", ["critique_a", "critique_b"])]
@@ -12,19 +12,141 @@ import os
 import random
 import logging
 import time
+import uuid
 import json
 import asyncio
+import collections
+import threading
+from collections import namedtuple
 import aiohttp
 import requests
-from typing import Dict, List, Optional, Tuple, Union, Any
+from requests.adapters import HTTPAdapter
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set, Tuple, Union, Any, Mapping
 from dotenv import load_dotenv
 
+try:
+    from aiohttp_socks import ProxyConnector
+except ImportError:  # Optional: only needed for socks4:// / socks5:// proxies
+    ProxyConnector = None
+
 # Load environment variables
 load_dotenv()
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Retry backoff settings (truncated exponential backoff with jitter)
+RETRY_BASE_DELAY = 1.0  # Seconds before the first retry
+RETRY_MAX_DELAY = 30.0  # Upper bound for a single backoff delay, Retry-After included
+RETRY_JITTER = 0.5  # Delay is scaled by a random factor in [1 - jitter, 1 + jitter]
+RETRY_STATUS_CODES = (429, 503)  # Statuses that rotate the proxy and retry
+
+# Proxy selection weighting
+PROXY_LATENCY_EWMA_ALPHA = 0.2  # Weight of the newest latency sample in the moving average
+PROXY_DEFAULT_LATENCY = 1.0  # Assumed latency (seconds) for proxies without samples
+
+# Number of user agents drawn per refill of the user-agent ring buffer
+USER_AGENT_BATCH_SIZE = 256
+
+# Connection pool settings for pooled aiohttp sessions
+AIOHTTP_CONNECTOR_OPTIONS = {
+    'ssl': False,
+    'limit': 200,
+    'limit_per_host': 50,
+    'ttl_dns_cache': 300,  # Cache DNS lookups for 5 minutes
+    'use_dns_cache': True,
+    'enable_cleanup_closed': True,
+    'keepalive_timeout': 75
+}
+
+# Proxy parsed once at startup: raw config string plus the URLs derived from it
+ProxyEntry = namedtuple('ProxyEntry', ['raw', 'http_url', 'https_url', 'proxies_dict', 'is_socks'])
+
+class ProxyUnsupportedError(RuntimeError):
+    """Raised when a proxy needs an optional dependency that is not installed."""
+
+# Exceptions worth retrying on another proxy; anything else fails the request immediately
+RETRIABLE_ASYNC_ERRORS = (
+    aiohttp.ClientConnectorError,
+    aiohttp.ClientOSError,  # Connection reset/refused mid-request, common with flaky proxies
+    aiohttp.ServerTimeoutError,
+    aiohttp.ServerDisconnectedError,
+    asyncio.TimeoutError,
+    ProxyUnsupportedError
+)
+RETRIABLE_SYNC_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError
+)
+
+# Maximum number of successful GET responses kept by make_request(cache=True)
+GET_CACHE_SIZE = 256
+
+# Client-side adaptive throttling (per proxy and host)
+THROTTLE_INITIAL_RATE = 5.0  # Requests per second before any 429 is seen
+THROTTLE_MIN_RATE = 0.1
+THROTTLE_MAX_RATE = 10.0
+THROTTLE_CAPACITY = 5.0  # Burst size
+THROTTLE_DECREASE_FACTOR = 0.5  # Rate multiplier applied on a 429
+THROTTLE_INCREASE_STEP = 0.1  # Rate added after each successful request
+
+class TokenBucket:
+    """
+    Token bucket that shapes outbound request rate.
+    
+    The rate adapts AIMD-style: it is halved when the server answers 429 and
+    grows additively while requests succeed.
+    """
+    
+    def __init__(self, rate: float = THROTTLE_INITIAL_RATE, capacity: float = THROTTLE_CAPACITY):
+        """
+        Initialize the token bucket.
+        
+        Args:
+            rate (float): Tokens added per second
+            capacity (float): Maximum number of stored tokens
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take one token, returning how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+    
+    def acquire_blocking(self):
+        """Wait (blocking) until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def acquire(self):
+        """Wait (asynchronously) until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def multiplicative_decrease(self, factor: float = THROTTLE_DECREASE_FACTOR):
+        """Slow down after the server signalled rate limiting."""
+        with self._lock:
+            self.rate = max(THROTTLE_MIN_RATE, self.rate * factor)
+    
+    def additive_increase(self, step: float = THROTTLE_INCREASE_STEP):
+        """Speed up after a successful request."""
+        with self._lock:
+            self.rate = min(THROTTLE_MAX_RATE, self.rate + step)
+
 class BurnerManager:
     """
     Manages proxy rotation and user-agent switching for API requests.
@@ -40,6 +162,15 @@ class BurnerManager:
         # Load configuration from environment variables
         self.proxies = os.getenv('PROXIES', '').split(',')
         self.proxies = [p.strip() for p in self.proxies if p.strip()]
+        # Parse proxies once; invalid entries are reported here and never selected
+        self._proxy_entries: Dict[str, ProxyEntry] = {}
+        for proxy in self.proxies:
+            entry = self._parse_proxy(proxy)
+            if entry is None:
+                logger.error(f"Invalid proxy format: {proxy}")
+            else:
+                self._proxy_entries[proxy] = entry
+        self.proxies = list(self._proxy_entries)
         
         self.user_agents = os.getenv('USER_AGENTS', '').split(',')
         self.user_agents = [ua.strip() for ua in self.user_agents if ua.strip()]
@@ -52,16 +183,32 @@ class BurnerManager:
                 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             ]
         
+        # Pre-drawn user agents, refilled in batches by get_identity
+        self._ua_ring: collections.deque = collections.deque()
+        
         self.burner_mode = os.getenv('BURNER_MODE', 'true').lower() == 'true'
         
         # Track working and failed proxies
-        self.working_proxies = []
-        self.failed_proxies = []
+        self.working_proxies: Set[str] = set()
+        self.failed_proxies: Set[str] = set()
+        # Per-proxy latency/error stats used to weight proxy selection
+        self._proxy_stats: Dict[str, Dict[str, float]] = {}
         
         # Current proxy and user agent
         self.current_proxy = None
         self.current_user_agent = None
         
+        # Long-lived aiohttp sessions keyed by proxy so connections are pooled (the user agent
+        # is sent per request, keeping at most one session per proxy), and the event loop they belong to
+        self._sessions: Dict[Optional[str], aiohttp.ClientSession] = {}
+        self._sessions_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Keep-alive requests sessions keyed by proxy for the sync path
+        self._req_sessions: Dict[str, requests.Session] = {}
+        # Adaptive rate limiters keyed by (proxy, host)
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        # LRU cache of successful GET responses, keyed by URL (opt-in per request)
+        self._get_cache: collections.OrderedDict = collections.OrderedDict()
+        
         logger.info(f"Burner manager initialized with {len(self.proxies)} proxies and {len(self.user_agents)} user agents")
         logger.info(f"Burner mode: {self.burner_mode}")
     
@@ -72,8 +219,10 @@ class BurnerManager:
         Returns:
             tuple: (proxy_dict, user_agent)
         """
-        # Select a random user agent
-        user_agent = random.choice(self.user_agents)
+        # Select a random user agent from the pre-drawn batch
+        if not self._ua_ring:
+            self._ua_ring.extend(random.choices(self.user_agents, k=USER_AGENT_BATCH_SIZE))
+        user_agent = self._ua_ring.popleft()
         
         # If burner mode is disabled or no proxies available, return None for proxy
         if not self.burner_mode or not self.proxies:
@@ -81,68 +230,213 @@ class BurnerManager:
         
         # Prioritize working proxies if available
         if self.working_proxies:
-            proxy = random.choice(self.working_proxies)
+            proxy = self._select_proxy(list(self.working_proxies))
         else:
             # Filter out failed proxies
             available_proxies = [p for p in self.proxies if p not in self.failed_proxies]
             if not available_proxies:
                 # Reset failed proxies if all have failed
-                self.failed_proxies = []
+                self.failed_proxies.clear()
                 available_proxies = self.proxies
             
-            proxy = random.choice(available_proxies) if available_proxies else None
+            proxy = self._select_proxy(available_proxies) if available_proxies else None
         
         # Update current proxy and user agent
         self.current_proxy = proxy
         self.current_user_agent = user_agent
         
-        # Convert proxy to dictionary format for requests
-        proxy_dict = None
-        if proxy:
-            # Parse proxy string (ip:port:username:password)
-            parts = proxy.split(':')
-            if len(parts) == 4:  # Full auth format
-                ip, port, username, password = parts
-                auth_str = f"{username}:{password}@"
-            elif len(parts) == 2:  # Simple ip:port format
-                ip, port = parts
-                auth_str = ""
-            else:
-                logger.error(f"Invalid proxy format: {proxy}")
-                return None, user_agent
-                
-            proxy_dict = {
-                "http": f"http://{auth_str}{ip}:{port}",
-                "https": f"https://{auth_str}{ip}:{port}"
-            }
+        # Use the prebuilt dictionary format for requests
+        proxy_dict = self._proxy_entries[proxy].proxies_dict if proxy else None
         
         return proxy_dict, user_agent
     
-    def mark_proxy_success(self):
+    @staticmethod
+    def _parse_proxy(proxy: str) -> Optional[ProxyEntry]:
         """
-        Mark the current proxy as working.
+        Parse a proxy string into its precomputed URLs.
+        
+        Args:
+            proxy (str): Proxy in ip:port or ip:port:username:password format,
+                optionally prefixed with a scheme such as socks5://
+            
+        Returns:
+            ProxyEntry: Parsed proxy, or None if the format is invalid
         """
-        if self.current_proxy and self.current_proxy not in self.working_proxies:
-            self.working_proxies.append(self.current_proxy)
-            if self.current_proxy in self.failed_proxies:
-                self.failed_proxies.remove(self.current_proxy)
+        raw = proxy
+        scheme = "http"
+        if "://" in proxy:
+            scheme, proxy = proxy.split("://", 1)
+            scheme = scheme.lower()
+        
+        # Parse proxy string (ip:port:username:password)
+        parts = proxy.split(':')
+        if len(parts) == 4:  # Full auth format
+            ip, port, username, password = parts
+            auth_str = f"{username}:{password}@"
+        elif len(parts) == 2:  # Simple ip:port format
+            ip, port = parts
+            auth_str = ""
+        else:
+            return None
+        
+        if scheme.startswith("socks"):
+            socks_url = f"{scheme}://{auth_str}{ip}:{port}"
+            return ProxyEntry(raw, socks_url, socks_url, {"http": socks_url, "https": socks_url}, True)
+        
+        http_url = f"http://{auth_str}{ip}:{port}"
+        https_url = f"https://{auth_str}{ip}:{port}"
+        return ProxyEntry(raw, http_url, https_url, {"http": http_url, "https": https_url}, False)
     
-    def mark_proxy_failure(self):
+    def _select_proxy(self, candidates: List[str]) -> str:
         """
-        Mark the current proxy as failed.
+        Pick a proxy, favouring ones with low latency and few errors.
+        
+        Args:
+            candidates (list): Proxies to choose from
+            
+        Returns:
+            str: Selected proxy
         """
-        if self.current_proxy:
-            if self.current_proxy in self.working_proxies:
-                self.working_proxies.remove(self.current_proxy)
-            if self.current_proxy not in self.failed_proxies:
-                self.failed_proxies.append(self.current_proxy)
+        weights = []
+        for proxy in candidates:
+            stats = self._proxy_stats.get(proxy)
+            if stats is None:
+                # Untried proxies get a neutral weight so they are still explored
+                weights.append(1.0 / (PROXY_DEFAULT_LATENCY + 0.1))
+                continue
+            # Laplace-smoothed success rate keeps every proxy selectable
+            success_rate = (stats['successes'] + 1) / (stats['successes'] + stats['errors'] + 1)
+            weights.append(success_rate / (stats['ewma_latency'] + 0.1))
+        return random.choices(candidates, weights=weights, k=1)[0]
+    
+    def _get_proxy_stats(self, proxy: str) -> Dict[str, float]:
+        """Get (creating if needed) the selection stats for a proxy."""
+        stats = self._proxy_stats.get(proxy)
+        if stats is None:
+            stats = {'ewma_latency': PROXY_DEFAULT_LATENCY, 'errors': 0, 'successes': 0}
+            self._proxy_stats[proxy] = stats
+        return stats
+    
+    def mark_proxy_success(self, latency: Optional[float] = None, proxy: Optional[str] = None):
+        """
+        Mark a proxy as working.
+        
+        Args:
+            latency (float, optional): Request latency in seconds, folded into the proxy's EWMA
+            proxy (str, optional): Proxy the request went through; defaults to the current proxy,
+                which concurrent requests may already have changed
+        """
+        proxy = proxy or self.current_proxy
+        if proxy:
+            stats = self._get_proxy_stats(proxy)
+            stats['successes'] += 1
+            if latency is not None:
+                stats['ewma_latency'] = (PROXY_LATENCY_EWMA_ALPHA * latency
+                                         + (1 - PROXY_LATENCY_EWMA_ALPHA) * stats['ewma_latency'])
+        
+        if proxy:
+            self.working_proxies.add(proxy)
+            self.failed_proxies.discard(proxy)
+    
+    def mark_proxy_failure(self, proxy: Optional[str] = None):
+        """
+        Mark a proxy as failed.
+        
+        Args:
+            proxy (str, optional): Proxy the request went through; defaults to the current proxy
+        """
+        proxy = proxy or self.current_proxy
+        if proxy:
+            self._get_proxy_stats(proxy)['errors'] += 1
+            self.working_proxies.discard(proxy)
+            self.failed_proxies.add(proxy)
+    
+    def _get_requests_session(self, proxy_dict: Optional[Dict[str, str]]) -> requests.Session:
+        """
+        Get the pooled requests session for the current proxy, creating it lazily.
+        
+        Args:
+            proxy_dict (dict, optional): Proxy mapping returned by get_identity
+            
+        Returns:
+            requests.Session: Session with a mounted connection pool
+        """
+        key = self.current_proxy if proxy_dict else ""
+        session = self._req_sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100, max_retries=0)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            if proxy_dict:
+                session.proxies = proxy_dict
+            self._req_sessions[key] = session
+        return session
+    
+    def close(self):
+        """
+        Close all pooled requests sessions.
+        """
+        for session in self._req_sessions.values():
+            session.close()
+        self._req_sessions.clear()
+    
+    def _backoff_delay(self, attempt: int, response_headers: Optional[Mapping[str, str]] = None) -> float:
+        """
+        Compute the delay before the next retry attempt.
+        
+        Args:
+            attempt (int): Number of attempts made so far (starting at 0)
+            response_headers (mapping, optional): Headers of a 429/503 response
+            
+        Returns:
+            float: Seconds to wait, never less than a server-provided Retry-After
+                unless that exceeds RETRY_MAX_DELAY
+        """
+        delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt)
+        delay *= 1 + random.uniform(-RETRY_JITTER, RETRY_JITTER)
+        
+        retry_after = response_headers.get('Retry-After') if response_headers else None
+        if retry_after:
+            try:
+                delay = max(float(retry_after), delay)
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    delay = max((retry_at - datetime.now(timezone.utc)).total_seconds(), delay)
+                except (TypeError, ValueError):
+                    logger.debug(f"Ignoring unparseable Retry-After header: {retry_after}")
+        
+        # A server asking for minutes or hours must not stall the caller that long
+        return min(delay, RETRY_MAX_DELAY)
+    
+    def _get_bucket(self, url: str, proxy: Optional[str]) -> TokenBucket:
+        """
+        Get the token bucket for a proxy and the URL's host.
+        
+        Args:
+            url (str): URL about to be requested
+            proxy (str, optional): Proxy the request goes through
+            
+        Returns:
+            TokenBucket: Rate limiter shared by requests to that host via that proxy
+        """
+        key = (proxy or "", urlparse(url).netloc)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket()
+            self._buckets[key] = bucket
+        return bucket
     
     def make_request(self, url: str, method: str = "GET", headers: Optional[Dict[str, str]] = None, 
                     data: Optional[Any] = None, json_data: Optional[Dict[str, Any]] = None, 
-                    max_retries: int = 3) -> Optional[requests.Response]:
+                    max_retries: int = 3, cache: bool = False) -> Optional[requests.Response]:
         """
         Make a request using a proxy with automatic rotation on failure.
         
+        POST retries all carry the same Idempotency-Key header so the server can
+        drop duplicates of a request that actually went through.
+        
         Args:
             url (str): URL to request
             method (str): HTTP method (GET, POST, etc.)
@@ -150,28 +444,45 @@ class BurnerManager:
             data (any, optional): Form data for POST requests
             json_data (dict, optional): JSON data for POST requests
             max_retries (int): Maximum number of retry attempts
+            cache (bool): For GET, reuse a previous successful response for the same URL
             
         Returns:
             requests.Response: Response object or None if all retries failed
         """
+        method_upper = method.upper()
+        use_cache = cache and method_upper == "GET"
+        if use_cache and url in self._get_cache:
+            self._get_cache.move_to_end(url)
+            logger.debug(f"Serving cached GET response for {url}")
+            return self._get_cache[url]
+        
+        # Work on a copy so keys set here never leak into a dict the caller reuses
+        headers = dict(headers or {})
+        if method_upper == "POST":
+            # One key per logical request, shared by all of its retries
+            headers.setdefault('Idempotency-Key', str(uuid.uuid4()))
+        
         retries = 0
         
         while retries < max_retries:
             # Get a proxy and user agent
             proxy, user_agent = self.get_identity()
+            # Stats are credited to this proxy even if another request rotates current_proxy meanwhile
+            selected_proxy = self.current_proxy if proxy else None
             
             # Prepare headers
-            if headers is None:
-                headers = {}
             headers['User-Agent'] = user_agent
             
             try:
-                logger.debug(f"Making {method} request to {url} using proxy {self.current_proxy}")
+                logger.debug(f"Making {method} request to {url} using proxy {selected_proxy}")
                 
-                response = requests.request(
+                session = self._get_requests_session(proxy)
+                bucket = self._get_bucket(url, selected_proxy)
+                bucket.acquire_blocking()
+                request_start = time.monotonic()
+                response = session.request(
                     method=method,
                     url=url,
-                    proxies=proxy,
                     headers=headers,
                     data=data,
                     json=json_data,
@@ -179,56 +490,100 @@ class BurnerManager:
                 )
                 
                 # Check if we hit a rate limit
-                if response.status_code == 429:
+                if response.status_code in RETRY_STATUS_CODES:
                     logger.warning(f"Rate limited. Rotating proxy and retrying. Status code: {response.status_code}")
-                    self.mark_proxy_failure()
+                    if response.status_code == 429:
+                        bucket.multiplicative_decrease()
+                    if selected_proxy:
+                        self.mark_proxy_failure(selected_proxy)
                     retries += 1
-                    time.sleep(random.uniform(5, 15))  # Random delay before retry
+                    if retries < max_retries:
+                        time.sleep(self._backoff_delay(retries - 1, response.headers))
                     continue
                 
                 # Mark proxy as working
-                self.mark_proxy_success()
+                if selected_proxy:
+                    self.mark_proxy_success(time.monotonic() - request_start, selected_proxy)
+                bucket.additive_increase()
+                
+                if use_cache and response.ok:
+                    self._get_cache[url] = response
+                    if len(self._get_cache) > GET_CACHE_SIZE:
+                        self._get_cache.popitem(last=False)
                 
                 return response
             
             except Exception as e:
+                if not isinstance(e, RETRIABLE_SYNC_ERRORS):
+                    logger.error(f"Request failed with unrecoverable error: {e}")
+                    return None
                 logger.error(f"Request failed: {e}")
-                self.mark_proxy_failure()
+                if selected_proxy:
+                    self.mark_proxy_failure(selected_proxy)
                 retries += 1
-                time.sleep(random.uniform(5, 15))  # Random delay before retry
+                if retries < max_retries:
+                    time.sleep(self._backoff_delay(retries - 1))
         
         logger.error(f"All {max_retries} retry attempts failed.")
         return None
     
-    async def get_aiohttp_session(self) -> Tuple[aiohttp.ClientSession, bool]:
+    def _get_session(self, proxy: Optional[str]) -> aiohttp.ClientSession:
         """
-        Get an aiohttp session with a random proxy and user agent.
+        Get the pooled aiohttp session for a proxy, creating it lazily.
         
+        Args:
+            proxy (str, optional): Raw proxy string, or None for a direct connection
+            
         Returns:
-            tuple: (session, is_proxy_used)
+            aiohttp.ClientSession: Session that is reused across requests
         """
-        # Get a proxy and user agent
-        proxy, user_agent = self.get_identity()
-        
-        # Prepare headers
-        headers = {
-            'User-Agent': user_agent
-        }
+        loop = asyncio.get_running_loop()
+        if self._sessions_loop is not loop:
+            # Sessions are bound to the loop that created them and cannot be closed from another one
+            if self._sessions:
+                logger.warning(f"Dropping {len(self._sessions)} aiohttp sessions created on another event loop")
+            self._sessions.clear()
+            self._sessions_loop = loop
         
-        # Create session
-        if proxy:
-            session = aiohttp.ClientSession(
-                headers=headers,
-                connector=aiohttp.TCPConnector(ssl=False),
-                timeout=aiohttp.ClientTimeout(total=30)
-            )
-            return session, True
-        else:
+        session = self._sessions.get(proxy)
+        if session is None or session.closed:
+            proxy_url = self._socks_proxy_url(proxy)
+            if proxy_url:
+                # SOCKS proxies are handled by the connector rather than the proxy= argument
+                if ProxyConnector is None:
+                    raise ProxyUnsupportedError(f"aiohttp_socks is required for SOCKS proxy {proxy}")
+                connector = ProxyConnector.from_url(proxy_url, **AIOHTTP_CONNECTOR_OPTIONS)
+            else:
+                connector = aiohttp.TCPConnector(**AIOHTTP_CONNECTOR_OPTIONS)
             session = aiohttp.ClientSession(
-                headers=headers,
+                connector=connector,
                 timeout=aiohttp.ClientTimeout(total=30)
             )
-            return session, False
+            self._sessions[proxy] = session
+        return session
+    
+    def _socks_proxy_url(self, proxy: Optional[str]) -> Optional[str]:
+        """Return the proxy URL if the proxy uses a SOCKS scheme, otherwise None."""
+        entry = self._proxy_entries.get(proxy) if proxy else None
+        return entry.http_url if entry and entry.is_socks else None
+    
+    async def aclose(self):
+        """
+        Close all pooled aiohttp sessions.
+        """
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+    
+    async def __aenter__(self) -> "BurnerManager":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close pooled aiohttp and requests sessions."""
+        await self.aclose()
+        self.close()
     
     async def make_async_request(self, url: str, method: str = "GET", headers: Optional[Dict[str, str]] = None, 
                                data: Optional[Any] = None, json_data: Optional[Dict[str, Any]] = None, 
@@ -247,57 +602,73 @@ class BurnerManager:
         Returns:
             aiohttp.ClientResponse: Response object or None if all retries failed
         """
+        headers = dict(headers or {})
         retries = 0
+        method_upper = method.upper()
+        send_json = method_upper == "POST" and bool(json_data)
         
         while retries < max_retries:
-            # Get a session with proxy and user agent
-            session, is_proxy_used = await self.get_aiohttp_session()
+            # Get a proxy and user agent, then the pooled session for them
+            proxy, user_agent = self.get_identity()
+            # Stats are credited to this proxy: other requests rotate current_proxy while this one is awaited
+            selected_proxy = self.current_proxy if proxy else None
+            # SOCKS proxies are already wired into the session's connector
+            entry = self._proxy_entries.get(selected_proxy) if selected_proxy else None
+            proxy_url = entry.http_url if entry and not entry.is_socks else None
             
             # Prepare headers
-            if headers is None:
-                headers = {}
-            headers['User-Agent'] = self.current_user_agent
+            headers['User-Agent'] = user_agent
             
             try:
-                logger.debug(f"Making async {method} request to {url} using proxy {self.current_proxy}")
+                session = self._get_session(selected_proxy)
+                logger.debug(f"Making async {method} request to {url} using proxy {selected_proxy}")
                 
-                if method.upper() == "GET":
-                    response = await session.get(url, headers=headers)
-                elif method.upper() == "POST":
-                    if json_data:
-                        response = await session.post(url, headers=headers, json=json_data)
-                    else:
-                        response = await session.post(url, headers=headers, data=data)
-                else:
-                    response = await session.request(method, url, headers=headers, data=data)
+                # JSON bodies are only sent with POST, matching the previous per-method dispatch
+                request_ctx = session.request(
+                    method_upper,
+                    url,
+                    headers=headers,
+                    json=json_data if send_json else None,
+                    data=None if send_json else data,
+                    proxy=proxy_url
+                )
+                
+                # Reading the body inside the context releases the connection back to the pool
+                bucket = self._get_bucket(url, selected_proxy)
+                await bucket.acquire()
+                request_start = time.monotonic()
+                async with request_ctx as response:
+                    response_data = await response.text() if response.status not in RETRY_STATUS_CODES else None
                 
                 # Check if we hit a rate limit
-                if response.status == 429:
+                if response.status in RETRY_STATUS_CODES:
                     logger.warning(f"Rate limited. Rotating proxy and retrying. Status code: {response.status}")
-                    self.mark_proxy_failure()
-                    await session.close()
+                    if response.status == 429:
+                        bucket.multiplicative_decrease()
+                    if selected_proxy:
+                        self.mark_proxy_failure(selected_proxy)
                     retries += 1
-                    await asyncio.sleep(random.uniform(5, 15))  # Random delay before retry
+                    if retries < max_retries:
+                        await asyncio.sleep(self._backoff_delay(retries - 1, response.headers))
                     continue
                 
                 # Mark proxy as working
-                self.mark_proxy_success()
-                
-                # Get response data
-                response_data = await response.text()
-                
-                # Close session
-                await session.close()
+                if selected_proxy:
+                    self.mark_proxy_success(time.monotonic() - request_start, selected_proxy)
+                bucket.additive_increase()
                 
                 return response, response_data
             
             except Exception as e:
+                if not isinstance(e, RETRIABLE_ASYNC_ERRORS):
+                    logger.error(f"Async request failed with unrecoverable error: {e}")
+                    return None, None
                 logger.error(f"Async request failed: {e}")
-                if is_proxy_used:
-                    self.mark_proxy_failure()
-                await session.close()
+                if selected_proxy:
+                    self.mark_proxy_failure(selected_proxy)
                 retries += 1
-                await asyncio.sleep(random.uniform(5, 15))  # Random delay before retry
+                if retries < max_retries:
+                    await asyncio.sleep(self._backoff_delay(retries - 1))
         
         logger.error(f"All {max_retries} async retry attempts failed.")
         return None, None
@@ -317,11 +688,13 @@ if __name__ == "__main__":
     response = burner.make_request("https://httpbin.org/ip")
     if response:
         print(f"Response: {response.text}")
+    burner.close()
     
     # Example: Make an async request
     async def test_async():
-        response, data = await burner.make_async_request("https://httpbin.org/ip")
-        if response:
-            print(f"Async response: {data}")
+        async with BurnerManager() as async_burner:
+            response, data = await async_burner.make_async_request("https://httpbin.org/ip")
+            if response:
+                print(f"Async response: {data}")
     
     asyncio.run(test_async())
@@ -158,3 +158,5 @@ class TelegramHandler:
         if self.message_queue:
             await self.process_batch()
         await self.client.disconnect()
+        await self.burner_manager.aclose()
+        self.burner_manager.close()
@@ -320,6 +320,8 @@ async def shutdown_event():
     """
     logger.info("AI Studio backend shutting down")
     # Clean up resources, close connections, etc.
+    await burner_manager.aclose()
+    burner_manager.close()
 
 # Run the application
 if __name__ == "__main__":